@@ -36,8 +36,6 @@ class AccountAdmin(UserAdmin):
         fieldsets (tuple): Custom organization of the fields into sections\
             for the user detail view.
         add_fieldsets (tuple): Custom fields used when creating a new user.
-        filter_horizontal (tuple): Empty because we don’t have any\
-            ManyToMany relationships.
         readonly_fields (tuple): Fields that cannot be edited\
             in the admin interface.
     """
@@ -90,9 +88,6 @@ class AccountAdmin(UserAdmin):
         }),
     )
 
-    # No many-to-many relationships are defined, so this option is left empty.
-    filter_horizontal = ()
-
     # Defines fields that should be displayed as read-only in the admin
     # interface, including `last_login` and `date_joined`.
     readonly_fields = ('last_login', 'date_joined')
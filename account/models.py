@@ -17,20 +17,23 @@ from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
 import uuid
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 
 
-class Roles(models.TextChoices):
+class Roles(models.IntegerChoices):
     """
     Enumeration of user roles used within the system.
     Provides predefined choices for access levels:
     - Customer: Regular end users who place orders.
     - Admin: Administrative users with elevated privileges.
     - Vendor: Users responsible for managing and fulfilling orders.
+
+    Stored as small integers so the column is 2 bytes wide instead of a
+    variable-length string.
     """
-    CUSTOMER = 'customer', 'Customer'
-    ADMIN = 'admin', 'Admin'
-    VENDOR = 'Vendor', 'vendor'
+    CUSTOMER = 1, 'Customer'
+    ADMIN = 2, 'Admin'
+    VENDOR = 3, 'Vendor'
 
 
 class AccountManager(BaseUserManager):
@@ -41,7 +44,17 @@ class AccountManager(BaseUserManager):
     and provides methods to create both regular users and superusers.
     """
     def get_object_by_public_id(self, public_id):
-        return get_object_or_404(self.model, public_id=public_id)
+        """
+        Returns the account with the given public id, looked up on the
+        indexed public_id column.
+
+        Raises:
+            Http404: If no account has the given public id.
+        """
+        try:
+            return self.get(public_id=public_id)
+        except self.model.DoesNotExist:
+            raise Http404('No Account matches the given query.')
 
     def create_user(self, email, password=None, **extra_fields):
         """
@@ -112,12 +125,12 @@ class Account(AbstractBaseUser, PermissionsMixin):
     )
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
-    phone_number = models.CharField(max_length=20)
+    # Stored normalized (see catering_site.phone_numbers) and indexed.
+    phone_number = models.CharField(max_length=20, db_index=True)
     address = models.CharField(max_length=255)
     city = models.CharField(max_length=100)
     state = models.CharField(max_length=50)
-    role = models.CharField(
-        max_length=20,
+    role = models.PositiveSmallIntegerField(
         choices=Roles.choices,
         default=Roles.CUSTOMER,
     )
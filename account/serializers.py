@@ -1,9 +1,11 @@
 from rest_framework import serializers
+from catering_site.serializers import CachedFieldsMixin
+from catering_site.phone_numbers import normalize_phone_number
 
 from account.models import Account
 
 
-class AccountSerializer(serializers.ModelSerializer):
+class AccountSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     id = serializers.UUIDField(
         source="public_id",
         read_only=True,
@@ -19,3 +21,34 @@ class AccountSerializer(serializers.ModelSerializer):
             'is_superuser', 'is_staff', 'date_joined', 'last_login',
         ]
         read_only_field = ['is_active', 'is_superuser', 'is_staff']
+
+    def validate_phone_number(self, value):
+        return normalize_phone_number(value)
+
+
+class AccountReadSerializer(serializers.Serializer):
+    """
+    Read-only representation of an account with the same output as
+    `AccountSerializer`.
+
+    Fields are declared explicitly so read paths skip ModelSerializer's
+    model introspection when the serializer is built.
+    """
+    id = serializers.UUIDField(
+        source="public_id",
+        read_only=True,
+        format="hex"
+    )
+    email = serializers.EmailField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    phone_number = serializers.CharField(read_only=True)
+    address = serializers.CharField(read_only=True)
+    city = serializers.CharField(read_only=True)
+    state = serializers.CharField(read_only=True)
+    date_of_birth = serializers.DateField(read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    is_superuser = serializers.BooleanField(read_only=True)
+    is_staff = serializers.BooleanField(read_only=True)
+    date_joined = serializers.DateTimeField(read_only=True)
+    last_login = serializers.DateTimeField(read_only=True)
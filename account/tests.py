@@ -1,3 +1,57 @@
-from django.test import TestCase
+"""
+account.tests
+=============
+Unit tests for the account app serializers.
 
-# Create your tests here.
+These tests make sure serializing the profile only reads columns already
+on the account row, so the profile endpoint never pays for extra
+permission or group queries.
+"""
+import pytest
+from account.models import Account
+from account.serializers import AccountSerializer, AccountReadSerializer
+
+
+@pytest.fixture
+def account():
+    """
+    Creates and returns an Account with the minimum required fields.
+    Returns:
+        Account: A newly created account with the email 'test@example.com'.
+    """
+    return Account.objects.create_user(
+        email='test@example.com',
+        password='s3cure-pass',
+        first_name='Test',
+        last_name='User',
+        phone_number='08000000000',
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'serializer_class', [AccountSerializer, AccountReadSerializer]
+)
+def test_account_serialization_issues_no_queries(
+    serializer_class, account, django_assert_num_queries
+):
+    """
+    Test that serializing an already loaded account runs no SQL, i.e. the
+    `is_staff`/`is_superuser` flags come from the row itself and no
+    `user_permissions` or `groups` lookup is triggered.
+    """
+    with django_assert_num_queries(0):
+        data = serializer_class(account).data
+    assert data['email'] == account.email
+    assert data['id'] == account.public_id.hex
+
+
+@pytest.mark.django_db
+def test_read_serializer_matches_model_serializer(account):
+    """
+    Test that the read-only serializer used by the profile GET returns the
+    same payload as the ModelSerializer used for updates.
+    """
+    assert AccountReadSerializer(account).data == (
+        AccountSerializer(account).data
+    )
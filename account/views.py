@@ -10,7 +10,7 @@ HTTP Methods:
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
-from account.serializers import AccountSerializer
+from account.serializers import AccountSerializer, AccountReadSerializer
 from rest_framework.permissions import IsAuthenticated
 
 
@@ -33,7 +33,7 @@ def profile(request):
     user = request.user
 
     if request.method == 'GET':
-        serializer = AccountSerializer(user)
+        serializer = AccountReadSerializer(user)
         return Response(serializer.data)
 
     elif request.method == 'PATCH':
@@ -3,10 +3,49 @@ Admin configuration for the Booking model in the bookings app.
 
 This module registers the Booking model with the Django admin site and
 customizes its display, filtering, and search options for easier management.
+It also provides a CSV export action that streams the selected bookings.
 """
+import csv
 from django.contrib import admin
+from django.http import StreamingHttpResponse
 from .models import Booking
 
+# Bookings fetched per database round-trip while exporting.
+EXPORT_CHUNK_SIZE = 2000
+
+# Leading characters that make spreadsheet apps treat a cell as a formula.
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+EXPORT_FIELDS = (
+    'booking_id', 'full_name', 'email', 'phone_number', 'event_type',
+    'event_date', 'number_of_guests', 'venue_location', 'status',
+    'date_submitted',
+)
+
+
+class Echo:
+    """
+    File-like object whose `write` returns the value instead of buffering
+    it, so `csv.writer` rows can be streamed straight to the response.
+    """
+
+    def write(self, value):
+        return value
+
+
+def csv_safe(value):
+    """
+    Escapes a CSV cell that a spreadsheet would evaluate as a formula.
+
+    Booking fields are submitted by anonymous users, so text starting with
+    `=`, `+`, `-`, `@`, a tab or a carriage return is prefixed with `'`.
+    Non-text values are returned unchanged.
+    """
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
     """
@@ -16,6 +55,7 @@ class BookingAdmin(admin.ModelAdmin):
     - Filters available in the sidebar (`list_filter`)
     - Fields searchable via the search bar (`search_fields`)
     - Fields set as read-only in the admin form (`readonly_fields`)
+    - A streaming CSV export action (`export_as_csv`)
     """
     list_display = (
         'booking_id',
@@ -26,11 +66,52 @@ class BookingAdmin(admin.ModelAdmin):
         'event_date',
         'number_of_guests',
         'venue_location',
-        'is_pending',
-        'is_confirmed',
-        'is_declined',
+        'status',
         'date_submitted',
     )
-    list_filter = ('event_type', 'is_confirmed', 'is_pending', 'is_declined', 'event_date')
+    list_filter = ('event_type', 'status', 'event_date')
     search_fields = ('full_name', 'email', 'phone_number', 'venue_location')
-    readonly_fields = ('booking_id', 'date_submitted')
\ No newline at end of file
+    readonly_fields = ('booking_id', 'date_submitted')
+    autocomplete_fields = ('user',)
+    actions = ('export_as_csv',)
+
+    def get_queryset(self, request):
+        """
+        Leave out the free-text columns that the changelist never renders.
+        """
+        return (
+            super().get_queryset(request)
+            .defer('special_requests', 'additional_info')
+        )
+
+    @admin.action(description='Export selected bookings to CSV')
+    def export_as_csv(self, request, queryset):
+        """
+        Streams the selected bookings as a CSV file.
+
+        Rows are read with `iterator()` so memory use stays bounded by
+        `EXPORT_CHUNK_SIZE` rather than the number of selected bookings.
+        Cells are escaped with `csv_safe` against formula injection.
+        """
+        rows = (
+            queryset
+            .only(*EXPORT_FIELDS)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        writer = csv.writer(Echo())
+
+        def stream():
+            yield writer.writerow(EXPORT_FIELDS)
+            for booking in rows:
+                yield writer.writerow(
+                    [
+                        csv_safe(getattr(booking, field))
+                        for field in EXPORT_FIELDS
+                    ]
+                )
+
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = (
+            'attachment; filename="bookings.csv"'
+        )
+        return response
@@ -20,9 +20,7 @@ Fields:
     special_requests (TextField): Any special requests from the customer (optional).
     additional_info (TextField): Additional information about the booking (optional).
     date_submitted (DateTimeField): Timestamp when the booking was submitted.
-    is_pending (BooleanField): Indicates if the booking is pending.
-    is_confirmed (BooleanField): Indicates if the booking has been confirmed.
-    is_declined (BooleanField): Indicates if the booking has been declined.
+    status (CharField): Whether the booking is pending, confirmed or declined.
 
 Methods:
     __str__(): Returns a string representation of the booking.
@@ -49,9 +47,8 @@ class Booking(models.Model):
         special_requests (TextField): Special requests from the customer.
         additional_info (TextField): Additional booking information (optional).
         date_submitted (DateTimeField): Timestamp when booking was submitted.
-        is_pending (BooleanField): Indicates if the booking is pending.
-        is_confirmed (BooleanField): Indicates if the booking is confirmed.
-        is_declined (BooleanField): Indicates if the booking is declined.
+        status (CharField): Whether the booking is pending, confirmed or
+            declined.
 
     Methods:
         __str__(): Returns a string representation of the booking.
@@ -74,6 +71,12 @@ class Booking(models.Model):
         ('200-300', '200 - 300'),
         ('300+', '300+'),
     ]
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('confirmed', 'Confirmed'),
+        ('declined', 'Declined'),
+    ]
     booking_id = models.UUIDField(
         default=uuid.uuid4, editable=False, unique=True
     )
@@ -86,7 +89,8 @@ class Booking(models.Model):
     )
     full_name = models.CharField(max_length=255)
     email = models.EmailField()
-    phone_number = models.CharField(max_length=20)
+    # Stored normalized (see catering_site.phone_numbers) and indexed.
+    phone_number = models.CharField(max_length=20, db_index=True)
     event_type = models.CharField(
         max_length=50,
         choices=EVENT_TYPES,
@@ -100,9 +104,31 @@ class Booking(models.Model):
     special_requests = models.TextField(blank=True, null=True)
     additional_info = models.TextField(blank=True, null=True)
     date_submitted = models.DateTimeField(auto_now_add=True)
-    is_pending = models.BooleanField(default=True)
-    is_confirmed = models.BooleanField(default=False)
-    is_declined = models.BooleanField(default=False)
+    # A single status column instead of three booleans keeps the states
+    # mutually exclusive and lets one index serve status filters.
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='pending',
+        db_index=True,
+    )
+
+    class Meta:
+        # Composite indexes backing the admin filters and per-user listings,
+        # so filtered changelists are range scans ordered by event date.
+        indexes = [
+            models.Index(fields=['status', 'event_date']),
+            models.Index(fields=['user', '-event_date']),
+            models.Index(fields=['event_type', 'event_date']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(
+                    status__in=['pending', 'confirmed', 'declined']
+                ),
+                name='booking_status_valid',
+            ),
+        ]
 
     def __str__(self):
         """
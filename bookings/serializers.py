@@ -10,11 +10,38 @@ model, with 'booking_id' and 'date_submitted' set as read-only fields.
         (read-only).
 
 """
+from django.db import transaction
 from rest_framework import serializers
+from catering_site.serializers import CachedFieldsMixin
+from catering_site.phone_numbers import normalize_phone_number
 from .models import Booking
 
+# Most bookings one request may submit as a JSON array. The create endpoint
+# is open to anonymous clients, so batches are kept small.
+MAX_BOOKINGS_PER_REQUEST = 20
 
-class BookingSerializer(serializers.ModelSerializer):
+
+class BookingListSerializer(serializers.ListSerializer):
+    """
+    List serializer used when a batch of bookings is submitted at once.
+
+    Rejects empty batches and batches longer than `MAX_BOOKINGS_PER_REQUEST`
+    with a 400, then inserts every validated booking with one `bulk_create`
+    inside a single transaction instead of saving the rows one at a time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('allow_empty', False)
+        kwargs.setdefault('max_length', MAX_BOOKINGS_PER_REQUEST)
+        super().__init__(*args, **kwargs)
+
+    def create(self, validated_data):
+        bookings = [Booking(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            return Booking.objects.bulk_create(bookings)
+
+
+class BookingSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Booking model, converting model instances to and from
     JSON format.
@@ -31,20 +58,26 @@ class BookingSerializer(serializers.ModelSerializer):
         special_requests (TextField): Special requests from the customer.
         additional_info (TextField): Additional booking information (optional).
         date_submitted (DateTimeField): Timestamp when booking was submitted.
-        is_confirmed (BooleanField): Indicates if the booking is confirmed.
+        status (CharField): Whether the booking is pending, confirmed or
+            declined.
     """
-
-    class Meta:
-        model = Booking
-        fields = '__all__'
     booking_id = serializers.UUIDField(
         read_only=True,
+        format='hex',
     )
 
     class Meta:
         model = Booking
-        fields = '__all__'
+        fields = [
+            'id', 'booking_id', 'user', 'full_name', 'email',
+            'phone_number', 'event_type', 'event_date', 'number_of_guests',
+            'venue_location', 'special_requests', 'additional_info',
+            'date_submitted', 'status',
+        ]
         read_only_fields = (
-            'user', 'booking_id', 'date_submitted',
-            'is_pending', 'is_confirmed', 'is_declined'
+            'user', 'booking_id', 'date_submitted', 'status',
         )
+        list_serializer_class = BookingListSerializer
+
+    def validate_phone_number(self, value):
+        return normalize_phone_number(value)
@@ -1,3 +1,72 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .admin import csv_safe
+from .models import Booking
+from .serializers import MAX_BOOKINGS_PER_REQUEST
+
+
+def booking_payload(**overrides):
+    payload = {
+        'full_name': 'Ada Obi',
+        'email': 'ada@example.com',
+        'phone_number': '+2348023728690',
+        'event_type': 'wedding',
+        'event_date': '2030-01-01',
+        'number_of_guests': '50-100',
+        'venue_location': 'Lagos',
+    }
+    payload.update(overrides)
+    return payload
+
+
+class CreateBookingTests(TestCase):
+    """
+    The create endpoint accepts one booking object or a bounded array.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('create-booking')
+
+    def post(self, body):
+        return self.client.post(self.url, body, format='json')
+
+    def test_single_booking_is_created(self):
+        response = self.post(booking_payload())
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_booking_array_is_created(self):
+        response = self.post([booking_payload(), booking_payload()])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['data']), 2)
+        self.assertEqual(Booking.objects.count(), 2)
+
+    def test_empty_array_is_rejected(self):
+        response = self.post([])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Booking.objects.count(), 0)
+
+    def test_oversize_array_is_rejected(self):
+        response = self.post(
+            [booking_payload()] * (MAX_BOOKINGS_PER_REQUEST + 1)
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Booking.objects.count(), 0)
+
+
+class CsvSafeTests(TestCase):
+    """
+    Exported cells that a spreadsheet would run as formulas are escaped.
+    """
+
+    def test_formula_cells_are_prefixed(self):
+        for value in ('=SUM(A1)', '+1', '-1', '@cmd'):
+            self.assertEqual(csv_safe(value), f"'{value}")
+
+    def test_other_values_are_unchanged(self):
+        for value in ('Ada Obi', 42, None):
+            self.assertEqual(csv_safe(value), value)
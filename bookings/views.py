@@ -16,9 +16,17 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework import status
 from rest_framework.response import Response
+from django.views.decorators.cache import cache_control
 from .serializers import BookingSerializer
 from .models import Booking
 
+# The booking choices are class-level constants, so the payload is built
+# once per process instead of on every request.
+BOOKING_CHOICES_PAYLOAD = {
+    'event_types': Booking.EVENT_TYPES,
+    'number_of_guests': Booking.NUMBER_OF_GUEST,
+}
+
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -28,6 +36,9 @@ def create_booking(request):
 
     This view receives booking data from the request, validates it using
     the BookingSerializer, and saves the booking if the data is valid.
+    A non-empty list of up to `MAX_BOOKINGS_PER_REQUEST` bookings may also
+    be submitted, in which case they are all validated and inserted in one
+    batch.
     Upon successful creation, it returns a JSON response with a success
     message and the serialized booking data.
 
@@ -42,20 +53,27 @@ def create_booking(request):
         ValidationError: If the provided data is invalid, a 400 response is
         automatically returned.
     """
-    data = request.data.copy()
-    if request.user.is_authenticated:
-        data['user'] = request.user.public_id
-    serializer = BookingSerializer(data=data)
+    many = isinstance(request.data, list)
+    serializer = BookingSerializer(data=request.data, many=many)
     serializer.is_valid(raise_exception=True)
-    serializer.save()
+    # `user` is read-only on the serializer, so it is attached at save time
+    # rather than by copying the payload and injecting it.
+    serializer.save(
+        user=request.user if request.user.is_authenticated else None
+    )
+    message = (
+        'Catering Requests Submitted Successfully' if many
+        else 'Catering Request Submitted Successfully'
+    )
     return Response(
         {
-            'message': 'Catering Request Submitted Successfully',
+            'message': message,
             'data': serializer.data
         },
         status=status.HTTP_201_CREATED
     )
 
+@cache_control(public=True, max_age=86400)
 @api_view(['GET'])
 def get_booking_choices(request):
     """
@@ -63,14 +81,12 @@ def get_booking_choices(request):
     
     This view provides a list of available event types for booking
     requests. It returns a JSON response containing the event types
-    and their corresponding labels.
+    and their corresponding labels. Since the choices only change on
+    deploy, the response is marked cacheable by browsers and proxies.
     Args:
         request (Request): The HTTP request object.
     Returns:
         Response: A DRF Response object containing the event types and
         their labels.
     """
-    return Response({
-        'event_types': Booking.EVENT_TYPES,
-        'number_of_guests': Booking.NUMBER_OF_GUEST,
-    }, status=status.HTTP_200_OK)
+    return Response(BOOKING_CHOICES_PAYLOAD, status=status.HTTP_200_OK)
@@ -19,6 +19,8 @@ class CartAdmin(admin.ModelAdmin):
         'is_active',
         'paid'
     )
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
 
     def get_user_email(self, obj):
         return obj.user.email if obj.user else 'Anonymous'
@@ -42,6 +44,7 @@ class ExtraItemAdmin(admin.ModelAdmin):
 class CartItemAdmin(admin.ModelAdmin):
     list_display = ('cart', 'dish', 'quantity', 'unit_price', 'total_price')
     search_fields = ('cart__cart_code', 'dish__name')
+    list_select_related = ('cart', 'dish', 'cart__user')
     inlines = (CartItemExtraInline,)
 
     fieldsets = (
@@ -59,3 +62,8 @@ class CartItemAdmin(admin.ModelAdmin):
             'fields': ('cart', 'dish', 'quantity', 'extras', 'special_instruction', 'unit_price', 'total_price'),
         }),
     )
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(
+            'extra_items__extra'
+        )
@@ -37,7 +37,7 @@ class Cart(models.Model):
             showing the user and status
         """
         return (
-            f'Cart for {self.user.email if self.user else "User"} - '
+            f'Cart for {self.user.email if self.user_id else "User"} - '
             f'{"Active" if self.is_active else "Completed"}'
         )
 
@@ -68,7 +68,13 @@ class CartItem(models.Model):
         default=0
     )
 
-    
+    class Meta:
+        # Backs the (cart, dish) lookup in get_cart_item. Not unique: adding
+        # the same dish again with other extras creates a separate item.
+        indexes = [
+            models.Index(fields=['cart', 'dish']),
+        ]
+
     def __str__(self):
         """
         Returns a string representation of the cart item,\
@@ -100,6 +106,14 @@ class CartItemExtra(models.Model):
         on_delete=models.CASCADE
     )
     quantity = models.IntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['cart_item', 'extra'],
+                name='unique_cart_item_extra'
+            ),
+        ]
     
     def __str__(self):
         """
@@ -6,26 +6,138 @@ conversion between model instances and their JSON representations for API
 responses and requests.
 
 Classes:
-    CartSerializer: Serializes Cart model instances, including user and
-        cart details.
+    CartItemExtraSerializer: Serializes the extras attached to a cart item.
+    CartItemListSerializer: List serializer used for many=True cart items.
     CartItemSerializer: Serializes CartItem model instances, including
         related dish, cart, quantity, and extras.
+    CartItemWriteSerializer: Validates and creates cart items.
+    CartItemUpdateWriteSerializer: Validates and updates cart items.
+    CartSerializer: Serializes Cart model instances, including user and
+        cart details.
+    SimpleCartSerializer: Serializes a cart's code and item count.
+
+Functions:
+    serialize_cart_stat_fast: Builds SimpleCartSerializer output for a
+        single cart from one `.values()` row.
 """
-from django.shortcuts import get_object_or_404
+import logging
+import uuid
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Prefetch, Sum, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from django.http import Http404
 from rest_framework import serializers
-from rest_framework.response import Response
+from catering_site.serializers import CachedFieldsMixin
 from .models import Cart, CartItem, CartItemExtra
-from dish.serializer import DishSerializer, ExtraItemsSerializer
 from dish.models import Dish, ExtraItem
 
+logger = logging.getLogger(__name__)
+
+ORDER_TYPE_CODES = frozenset(code for code, _ in Cart.ORDER_TYPES)
+
+CART_STAT_CACHE_TIMEOUT = 300
+
+
+def cart_stat_cache_key(cart_code):
+    """
+    Returns the cache key under which a cart's `get_cart_stat` payload is
+    stored. The code is normalised so hex and hyphenated forms share a key.
+    Args:
+        cart_code (UUID or str): The cart's code.
+    Returns:
+        str: The cache key.
+    Raises:
+        ValueError: If `cart_code` is not a valid UUID.
+    """
+    return f'cartstat:{uuid.UUID(str(cart_code))}'
+
+
+def invalidate_cart_stat(cart_code):
+    """
+    Drops the cached `get_cart_stat` payload for a cart once the current
+    transaction commits, so a concurrent poll can't re-cache stale counts
+    from before the write.
+    Args:
+        cart_code (UUID or str): The code of the cart that changed.
+    """
+    key = cart_stat_cache_key(cart_code)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def resolve_extras(extras):
+    """
+    Looks up every ExtraItem referenced in an `extra_items` payload with a
+    single `IN` query instead of one query per extra.
+    Args:
+        extras (dict): Mapping of ExtraItem ids to `{'quantity': n}` dicts.
+    Returns:
+        list: `(ExtraItem, quantity)` pairs, in payload order, for every
+            id that exists, with the quantity already coerced to int.
+            Unknown or malformed ids are left out, and an extra listed
+            under more than one key (e.g. "1" and "01") appears once, with
+            the last entry's quantity.
+    Raises:
+        ValidationError: If a quantity is not an integer.
+    """
+    ids = {}
+    for extra_id in extras:
+        try:
+            ids[extra_id] = int(extra_id)
+        except (TypeError, ValueError):
+            continue
+    extras_map = ExtraItem.objects.only('id', 'price').in_bulk(
+        set(ids.values())
+    )
+    resolved = {}
+    for extra_id, pk in ids.items():
+        if pk in extras_map:
+            try:
+                quantity = int(extras[extra_id].get('quantity', 1))
+            except (AttributeError, TypeError, ValueError):
+                raise serializers.ValidationError(
+                    {'extra_items': 'Each extra needs an integer quantity.'}
+                )
+            resolved[pk] = (extras_map[pk], quantity)
+    return list(resolved.values())
+
 
-class CartItemExtraSerializer(serializers.ModelSerializer):
+def upsert_cart(cart_code, order_type):
+    """
+    Creates the cart with the given code, or sets the order type on the
+    existing one, in a single `INSERT ... ON CONFLICT (cart_code) DO UPDATE`
+    statement instead of a SELECT followed by an INSERT or UPDATE.
+    Args:
+        cart_code (UUID): The unique code of the cart.
+        order_type (str): One of the `Cart.ORDER_TYPES` codes.
+    Returns:
+        Cart: The cart with its primary key set. Only `cart_code` and
+            `order_type` are guaranteed to reflect the stored row.
+    """
+    cart = Cart(cart_code=cart_code, order_type=order_type)
+    Cart.objects.bulk_create(
+        [cart],
+        update_conflicts=True,
+        unique_fields=['cart_code'],
+        update_fields=['order_type']
+    )
+    if cart.pk is None:
+        # Backends that can't return ids from an upsert
+        cart = Cart.objects.get(cart_code=cart_code)
+    return cart
+
+
+class CartItemExtraSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the CartItemExtra model, providing nested representation
     of ExtraItem associated with a CartItem. Used to serialize and deserialize
     extra items in a cart item.
     """
-    extra_name = serializers.SerializerMethodField()
+    extra_name = serializers.CharField(
+        source='extra.name', read_only=True, default=None
+    )
     extra_id = serializers.IntegerField(source='extra.id', read_only=True)
 
     class Meta:
@@ -37,16 +149,41 @@ class CartItemExtraSerializer(serializers.ModelSerializer):
             'quantity',
         )
 
-    def get_extra_name(self, obj):
+    def to_representation(self, instance):
         """
-        Returns the name of the extra item associated with the CartItemExtra.
-        This method is used to provide a human-readable representation
-        of the extra item in the serialized output.
+        Builds the output dict directly instead of dispatching through each
+        bound field. Every value is a plain int or str that the fields would
+        return unchanged, and this serializer is nested once per extra on
+        every cart item, so it is the hottest representation in the app.
         """
-        return obj.extra.name if obj.extra else None
+        extra = instance.extra
+        return {
+            'id': instance.id,
+            'extra_id': extra.id,
+            'extra_name': extra.name,
+            'quantity': instance.quantity,
+        }
 
 
-class CartItemSerializer(serializers.ModelSerializer):
+class CartItemListSerializer(serializers.ListSerializer):
+    """
+    List serializer for CartItemSerializer. Serializes every item with the
+    single child serializer bound to this list, so no per-item serializer
+    is constructed and the child's bound method is looked up only once.
+    Related rows the child reads are prefetched here as well, so callers
+    that pass an unprefetched queryset don't fall back to N+1 queries;
+    relations that are already loaded are left untouched.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        items = list(iterable)
+        CartItemSerializer.prefetch_objects(items)
+        to_representation = self.child.to_representation
+        return [to_representation(item) for item in items]
+
+
+class CartItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for CartItem model, providing nested representations 4 related
     Dish, Cart, and ExtraItems models. Used to serialize and deserialize cart
@@ -54,12 +191,18 @@ class CartItemSerializer(serializers.ModelSerializer):
     All related fields are read-only and represented using their respective
     serializers.
     """
-    dish_name = serializers.SerializerMethodField()
+    dish_name = serializers.CharField(
+        source='dish.name', read_only=True, default=None
+    )
     dish_id = serializers.IntegerField(source='dish.id', read_only=True)
     # cart_id = serializers.IntegerField(source='cart.id', read_only=True)
-    cart_code = serializers.SerializerMethodField()
+    cart_code = serializers.UUIDField(
+        source='cart.cart_code', read_only=True, default=None
+    )
     extra_items = CartItemExtraSerializer(many=True, read_only=True)
-    delivery_option = serializers.SerializerMethodField()
+    delivery_option = serializers.CharField(
+        source='cart.order_type', read_only=True, default=None
+    )
 
     class Meta:
         model = CartItem
@@ -77,35 +220,72 @@ class CartItemSerializer(serializers.ModelSerializer):
             'delivery_option',
             # 'note'
         )
-        read_only_fields = ['unit_price', 'total_price']
+        # Writes go through CartItemWriteSerializer and
+        # CartItemUpdateWriteSerializer; this serializer is read-only.
+        read_only_fields = [
+            'id',
+            'quantity',
+            'unit_price',
+            'total_price',
+            'special_instruction',
+        ]
+        list_serializer_class = CartItemListSerializer
 
-    def get_dish_name(self, obj):
+    @classmethod
+    def prefetch_queryset(cls, queryset=None):
         """
-        Returns the name of the dish associated with the CartItem.
-        This method is used to provide a human-readable representation
-        of the dish in the serialized output.
+        Returns the CartItem queryset with everything this serializer reads
+        loaded up-front: the dish and cart are joined, and the extras (with
+        their ExtraItem) are fetched in one additional query for all items.
+        Only the columns the serializer reads are selected.
+        Args:
+            queryset (QuerySet, optional): The CartItem queryset to extend.
+                Defaults to all cart items.
+        Returns:
+            QuerySet: The queryset with related rows eagerly loaded.
         """
-        return obj.dish.name if obj.dish else None
-
-    def get_cart_code(self, obj):
+        if queryset is None:
+            queryset = CartItem.objects.all()
+        extras = CartItemExtra.objects.select_related('extra').only(
+            'id', 'quantity', 'cart_item', 'extra__id', 'extra__name'
+        )
+        return queryset.select_related('dish', 'cart').only(
+            'id', 'quantity', 'unit_price', 'total_price',
+            'special_instruction', 'cart', 'dish',
+            'dish__id', 'dish__name', 'cart__cart_code', 'cart__order_type'
+        ).prefetch_related(Prefetch('extra_items', queryset=extras))
+
+    @classmethod
+    def prefetch_objects(cls, items):
         """
-        Returns the cart code associated with the CartItem.
-        This method is used to provide a human-readable representation
-        of the cart code in the serialized output.
+        Loads onto already fetched cart items the related rows this
+        serializer reads, e.g. an item that was just created or updated.
+        Relations that are already loaded are skipped, and the extras come
+        with their ExtraItem in a single query.
+        Args:
+            items (list): CartItem instances to serialize.
         """
-        return obj.cart.cart_code if obj.cart else None
-
-    def get_delivery_option(self, obj):
-        return obj.cart.order_type if obj.cart else None
+        prefetch_related_objects(
+            items,
+            'dish',
+            'cart',
+            Prefetch(
+                'extra_items',
+                queryset=CartItemExtra.objects.select_related('extra')
+            )
+        )
 
 
-class CartItemWriteSerializer(serializers.ModelSerializer):
+class CartItemWriteSerializer(
+    CachedFieldsMixin, serializers.ModelSerializer
+):
+    # Only what validate() and the read serializer need from the dish
     dish = serializers.PrimaryKeyRelatedField(
-        queryset=Dish.objects.all(),
+        queryset=Dish.objects.only('id', 'name', 'price'),
         write_only=True
     )
     extra_items = serializers.DictField(write_only=True, required=False)
-    cart_code = serializers.CharField(write_only=True)
+    cart_code = serializers.UUIDField(write_only=True)
     note = serializers.CharField(
         write_only=True,
         required=False,
@@ -127,24 +307,20 @@ class CartItemWriteSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         dish = attrs['dish']
         quantity = attrs.get('quantity', 1)
-        extras = self.initial_data.get('extra_items', {})
-
-        if extras and not isinstance(extras, dict):
-            raise serializers.ValidationError(
-                {'extra_items': 'Must be a dictionary'}
-            )
+        extras = attrs.get('extra_items', {})
 
         unit_price = dish.price
-        total = unit_price * quantity
-
+        # Resolved once here and handed to create() through validated_data
+        resolved = resolve_extras(extras)
+        attrs['_resolved_extras'] = resolved
         # Add extras to total price
-        for extra_id, data in extras.items():
-            try:
-                extra = ExtraItem.objects.get(id=extra_id)
-                qty = int(data.get('quantity', 1))
-                total += extra.price * qty
-            except ExtraItem.DoesNotExist:
-                continue
+        total = unit_price * quantity + sum(
+            (
+                extra.price * qty
+                for extra, qty in resolved
+            ),
+            Decimal('0')
+        )
 
         attrs['unit_price'] = unit_price
         attrs['total_price'] = total
@@ -157,30 +333,33 @@ class CartItemWriteSerializer(serializers.ModelSerializer):
         the provided cart_code does not exist, it is created.
         Sets the order type if provided and valid.
         Adds extra items to the CartItem if specified.
-        All operations are performed atomically to ensure data integrity.
+        All writes are performed atomically to ensure data integrity; the
+        extras are resolved before the transaction opens so it only spans
+        the writes themselves.
         Args:
             validated_data (dict): Validated data containing dish, quantity,
                 unit_price, and total_price for the CartItem.
         Returns:
             CartItem: The created CartItem instance.
         """
-
-        from django.db import transaction
-
-        cart_code = self.initial_data.get('cart_code')
-        note = self.initial_data.get('note', '')
-        orderoption = self.initial_data.get('orderoption')
-        extras = self.initial_data.get('extra_items', {})
+        cart_code = validated_data['cart_code']
+        note = validated_data.get('note', '')
+        orderoption = validated_data.get('orderoption')
+        resolved = validated_data.pop('_resolved_extras', None)
+        if resolved is None:
+            resolved = resolve_extras(validated_data.get('extra_items', {}))
+        extra_rows = [
+            CartItemExtra(extra=extra, quantity=qty)
+            for extra, qty in resolved
+        ]
 
         # Prevents partial saves (e.g. CartItem saved but an ExtraItem fails)
         with transaction.atomic():
-            # Get or create the cart
-            cart, _ = Cart.objects.get_or_create(cart_code=cart_code)
-
-            # Set order type if valid
-            if orderoption in dict(Cart.ORDER_TYPES):
-                cart.order_type = orderoption
-                cart.save()
+            # Get or create the cart, setting the order type if valid
+            if orderoption in ORDER_TYPE_CODES:
+                cart = upsert_cart(cart_code, orderoption)
+            else:
+                cart, _ = Cart.objects.get_or_create(cart_code=cart_code)
 
             # Create CartItem
             cart_item = CartItem.objects.create(
@@ -193,22 +372,16 @@ class CartItemWriteSerializer(serializers.ModelSerializer):
             )
 
             # Add extras
-            for extra_id, data in extras.items():
-                try:
-                    extra = ExtraItem.objects.get(id=extra_id)
-                    qty = int(data.get('quantity', 1))
-                    CartItemExtra.objects.create(
-                        cart_item=cart_item,
-                        extra=extra,
-                        quantity=qty
-                    )
-                except ExtraItem.DoesNotExist:
-                    continue
-
-            return cart_item
-
-
-class CartItemUpdateWriteSerializer(serializers.ModelSerializer):
+            for row in extra_rows:
+                row.cart_item = cart_item
+            CartItemExtra.objects.bulk_create(extra_rows)
+
+        return cart_item
+
+
+class CartItemUpdateWriteSerializer(
+    CachedFieldsMixin, serializers.ModelSerializer
+):
     note = serializers.CharField(
         write_only=True,
         required=False,
@@ -229,15 +402,28 @@ class CartItemUpdateWriteSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         quantity = attrs.get('quantity', self.instance.quantity)
-        extras = self.initial_data.get('extra_items', {})
+        extras = attrs.get('extra_items', {})
 
         unit_price = self.instance.dish.price
-        total = unit_price * quantity
 
-        for extra_id, data in extras.items():
-            extra = get_object_or_404(ExtraItem, id=extra_id)
-            qty = data.get('quantity', 1)
-            total += qty * extra.price
+        try:
+            requested = {int(extra_id) for extra_id in extras}
+        except (TypeError, ValueError):
+            raise serializers.ValidationError(
+                {'extra_items': 'Extra item ids must be integers.'}
+            )
+        resolved = resolve_extras(extras)
+        if {extra.id for extra, _ in resolved} != requested:
+            raise Http404('No ExtraItem matches the given query.')
+        attrs['_resolved_extras'] = resolved
+
+        total = unit_price * quantity + sum(
+            (
+                extra.price * qty
+                for extra, qty in resolved
+            ),
+            Decimal('0')
+        )
 
         attrs['unit_price'] = unit_price
         attrs['total_price'] = total
@@ -250,9 +436,11 @@ class CartItemUpdateWriteSerializer(serializers.ModelSerializer):
         and associated extra items.
         This method recalculates the total price based on the updated quantity
         and selected extras.
-        It first clears any existing extra items for the cart item,
-        then adds new extras as specified in the input data.
-        If an extra item does not exist, it is skipped.
+        The existing extra items are diffed against the input data by extra
+        id: new extras are inserted, changed quantities are updated and
+        extras no longer requested are deleted, one query per kind of change.
+        The extras were already checked by `validate`, which rejects a
+        malformed extra id with a 400 and an unknown one with a 404.
         The method updates the cart item's quantity, special instructions,
         unit price, and total price before saving the instance.
         Args:
@@ -263,26 +451,41 @@ class CartItemUpdateWriteSerializer(serializers.ModelSerializer):
         """
         quantity = validated_data.get('quantity', instance.quantity)
         note = validated_data.get('note', instance.special_instruction)
-        extras = self.initial_data.get('extra_items', {})
+        resolved = validated_data.pop('_resolved_extras', None)
+        if resolved is None:
+            resolved = resolve_extras(validated_data.get('extra_items', {}))
         unit_price = instance.dish.price
         total = unit_price * quantity
 
-        if instance.extra_items.all():
-            instance.extra_items.all().delete()
-
-        for extra_id, data in extras.items():
-            try:
-                extra = ExtraItem.objects.get(id=extra_id)
-                # print(f'\n\n {extra}')
-                qty = int(data.get('quantity', 1))
-                CartItemExtra.objects.create(
-                    cart_item=instance,
-                    extra=extra,
-                    quantity=qty
+        existing = {row.extra_id: row for row in instance.extra_items.all()}
+        to_create = []
+        to_update = []
+        keep = set()
+
+        for extra, qty in resolved:
+            total += extra.price * qty
+            keep.add(extra.id)
+            row = existing.get(extra.id)
+            if row is None:
+                to_create.append(
+                    CartItemExtra(cart_item=instance, extra=extra, quantity=qty)
                 )
-                total += extra.price * qty
-            except ExtraItem.DoesNotExist:
-                continue
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('added extra %s', extra.id)
+            elif row.quantity != qty:
+                row.quantity = qty
+                to_update.append(row)
+
+        to_delete = [
+            row.id for extra_id, row in existing.items()
+            if extra_id not in keep
+        ]
+        if to_delete:
+            CartItemExtra.objects.filter(id__in=to_delete).delete()
+        if to_update:
+            CartItemExtra.objects.bulk_update(to_update, ['quantity'])
+        if to_create:
+            CartItemExtra.objects.bulk_create(to_create)
 
         instance.quantity = quantity
         instance.special_instruction = note
@@ -293,7 +496,7 @@ class CartItemUpdateWriteSerializer(serializers.ModelSerializer):
         return instance
 
 
-class CartSerializer(serializers.ModelSerializer):
+class CartSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Cart model.
     Serializes the following fields: id, cart_code, user, created_at, and paid.
@@ -320,7 +523,7 @@ class CartSerializer(serializers.ModelSerializer):
         read_only_fields = ('created_at', 'paid', 'user')
 
 
-class SimpleCartSerializer(serializers.ModelSerializer):
+class SimpleCartSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Cart model that provides a simplified representation
     including the cart's ID, cart code, and the total number of items.
@@ -331,7 +534,9 @@ class SimpleCartSerializer(serializers.ModelSerializer):
             calculated by summing the quantity of each item.
     Methods:
         get_number_of_items(obj): Returns the sum of quantities for all
-            items in the cart instance.
+            items in the cart instance, preferring a `number_of_items`
+            annotation on the queryset, then already prefetched items,
+            and falling back to a SQL aggregate.
     """
     number_of_items = serializers.SerializerMethodField(read_only=True)
 
@@ -339,5 +544,47 @@ class SimpleCartSerializer(serializers.ModelSerializer):
         model = Cart
         fields = ['id', 'cart_code', 'number_of_items']
 
+    @classmethod
+    def prefetch_queryset(cls, queryset=None):
+        """
+        Returns the Cart queryset annotated with `number_of_items`, the item
+        quantities summed in SQL, so each cart is counted in the same query
+        that loads it.
+        Args:
+            queryset (QuerySet, optional): The Cart queryset to extend.
+                Defaults to all carts.
+        Returns:
+            QuerySet: The annotated queryset.
+        """
+        if queryset is None:
+            queryset = Cart.objects.all()
+        return queryset.annotate(
+            number_of_items=Coalesce(Sum('items__quantity'), 0)
+        )
+
     def get_number_of_items(self, obj):
-        return sum([item.quantity for item in obj.items.all()])
+        number_of_items = getattr(obj, 'number_of_items', None)
+        if number_of_items is not None:
+            return number_of_items
+        if 'items' in getattr(obj, '_prefetched_objects_cache', {}):
+            return sum(item.quantity for item in obj.items.all())
+        return obj.items.aggregate(total=Sum('quantity'))['total'] or 0
+
+
+def serialize_cart_stat_fast(queryset):
+    """
+    Returns the `SimpleCartSerializer` payload for the first cart in the
+    queryset, read as a single `.values()` row with the item count summed
+    in SQL, so no Cart instance or serializer is built.
+    Args:
+        queryset (QuerySet): A Cart queryset, usually filtered by cart_code.
+    Returns:
+        dict or None: The serialized cart, or None if no cart matches.
+    """
+    row = SimpleCartSerializer.prefetch_queryset(queryset).values(
+        'id', 'cart_code', 'number_of_items'
+    ).first()
+    if row is None:
+        return None
+    row['cart_code'] = str(row['cart_code'])
+    return row
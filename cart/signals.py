@@ -0,0 +1,43 @@
+"""
+cart.signals
+------------
+Keeps the cached `get_cart_stat` payloads in step with the database.
+
+The payload only depends on a cart's items and their quantities, so any
+CartItem save or delete (from the API, the admin or a shell) and any Cart
+delete drops the cached entry for that cart.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Cart, CartItem
+from .serializers import invalidate_cart_stat
+
+
+def _cart_code_for(item):
+    """
+    Returns the code of the cart a CartItem belongs to, without loading the
+    cart when it isn't already cached on the item.
+    Args:
+        item (CartItem): The cart item that changed.
+    Returns:
+        UUID or None: The cart code, or None if the cart no longer exists.
+    """
+    if CartItem.cart.is_cached(item):
+        return item.cart.cart_code
+    return Cart.objects.filter(pk=item.cart_id).values_list(
+        'cart_code', flat=True
+    ).first()
+
+
+@receiver(post_save, sender=CartItem)
+@receiver(post_delete, sender=CartItem)
+def invalidate_cart_stat_for_item(sender, instance, **kwargs):
+    cart_code = _cart_code_for(instance)
+    if cart_code is not None:
+        invalidate_cart_stat(cart_code)
+
+
+@receiver(post_delete, sender=Cart)
+def invalidate_cart_stat_for_cart(sender, instance, **kwargs):
+    invalidate_cart_stat(instance.cart_code)
@@ -195,3 +195,86 @@ def test_simpleCartSerializer(cart, cart_item):
     data = serializer.data
     assert data['cart_code'] == str(cart.cart_code)
     assert data['number_of_items'] == 2
+
+
+@pytest.mark.django_db
+def test_serialize_cart_stat_fast_matches_simple_cart_serializer(
+    cart, cart_item
+):
+    """
+    Test that the `.values()` cart stat fast path returns exactly what
+    SimpleCartSerializer produces for the same cart.
+    Args:
+        cart: A cart instance fixture.
+        cart_item: A cart item in that cart.
+    Asserts:
+        - serialize_cart_stat_fast output equals SimpleCartSerializer output.
+    """
+    queryset = Cart.objects.filter(cart_code=cart.cart_code)
+    assert serialize_cart_stat_fast(queryset) == (
+        SimpleCartSerializer(cart).data
+    )
+
+
+@pytest.mark.django_db
+def test_cart_item_extra_serializer(cart_item, extra):
+    """
+    Test that the hand-written CartItemExtraSerializer.to_representation
+    returns every declared field with the values the fields would produce.
+    Args:
+        cart_item: A cart item with extras attached.
+        extra: The ExtraItem instances attached to the cart item.
+    Asserts:
+        - Each serialized extra has exactly the Meta.fields keys.
+        - extra_id and extra_name come from the related ExtraItem.
+    """
+    rows = CartItemExtra.objects.filter(cart_item=cart_item).order_by('id')
+    data = CartItemExtraSerializer(rows, many=True).data
+    assert [set(row) for row in data] == [
+        set(CartItemExtraSerializer.Meta.fields)
+    ] * len(extra)
+    assert [(row['extra_id'], row['extra_name']) for row in data] == [
+        (item.id, item.name) for item in extra
+    ]
+
+
+@pytest.mark.django_db
+def test_cart_item_update_accepts_duplicate_extra_keys(cart_item, extra):
+    """
+    An extra listed under two spellings of its id ("1" and "01") is
+    resolved once and does not count as a missing extra.
+    """
+    pk = extra[0].id
+    serializer = CartItemUpdateWriteSerializer(
+        cart_item,
+        data={'extra_items': {
+            str(pk): {'quantity': 1}, f'0{pk}': {'quantity': 2},
+        }},
+        partial=True,
+    )
+    assert serializer.is_valid(), serializer.errors
+    assert serializer.validated_data['_resolved_extras'] == [(extra[0], 2)]
+
+
+@pytest.mark.django_db
+def test_cart_item_update_rejects_malformed_extra_id(cart_item):
+    serializer = CartItemUpdateWriteSerializer(
+        cart_item,
+        data={'extra_items': {'abc': {'quantity': 1}}},
+        partial=True,
+    )
+    assert not serializer.is_valid()
+    assert 'extra_items' in serializer.errors
+
+
+@pytest.mark.django_db
+def test_cart_item_update_unknown_extra_is_404(cart_item, extra):
+    from django.http import Http404
+    missing = max(item.id for item in extra) + 1
+    serializer = CartItemUpdateWriteSerializer(
+        cart_item,
+        data={'extra_items': {str(missing): {'quantity': 1}}},
+        partial=True,
+    )
+    with pytest.raises(Http404):
+        serializer.is_valid()
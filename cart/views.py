@@ -3,49 +3,65 @@ This module provides API views for managing cart operations in the
 catering site API.
 
 Views:
-    - add_dish: Adds a dish (with optional extra item) to a user's cart,
+    - add_dish: Adds a dish (with optional extra items) to a user's cart,
       creating the cart if it does not exist.
     - product_in_cart: Checks if a specific dish is already present in
       the user's cart.
+    - get_cart_stat: Returns a cart's code and total item count.
+    - get_cart_item: Returns the cart item for a given cart and dish.
+    - update_item: Updates a cart item's quantity, note and extras.
+
+All writes go through CartItemWriteSerializer and
+CartItemUpdateWriteSerializer; the views only validate, save and render.
 
 Dependencies:
-    - Uses Django models for Cart, CartItem, Dish, and ExtraItem.
+    - Uses Django models for Cart, CartItem, and Dish.
     - Utilizes Django REST Framework for API view handling,
       serialization, and HTTP responses.
 """
-from .models import *
+from .models import Cart, CartItem
 from rest_framework.decorators import api_view
-from dish.models import Dish, ExtraItem
-from .serializers import *
+from dish.models import Dish
+from .serializers import (
+    CART_STAT_CACHE_TIMEOUT,
+    CartItemSerializer,
+    CartItemUpdateWriteSerializer,
+    CartItemWriteSerializer,
+    cart_stat_cache_key,
+    serialize_cart_stat_fast,
+)
 from rest_framework.response import Response
 from rest_framework import status
-from django.db import transaction
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
+from django.views.decorators.cache import cache_control
 
 
 @api_view(['POST'])
 def add_dish(request):
     """
-    Adds a dish (and optionally an extra item) to a user's cart.
+    Adds a dish (and optionally extra items) to a user's cart.
 
-    This view retrieves or creates a cart using the provided cart code,
-    fetches the specified dish and optional extra item, and then creates
-    or retrieves a CartItem linking them. If the CartItem is newly
-    created, its quantity is set to 1.
+    Validation and all writes are handled by CartItemWriteSerializer,
+    which gets or creates the cart for the provided cart code, creates
+    the CartItem and attaches the requested extras. The created item is
+    returned through CartItemSerializer.
 
     Args:
         request (Request): The HTTP request object containing
-            'cart_code', 'dish_id', and optionally 'extra_item_id'
-            in its data.
+            'cart_code', 'dish', and optionally 'quantity', 'note',
+            'orderoption' and 'extra_items' in its data.
 
     Returns:
         Response: A DRF Response object containing a success message
-            and CartItem data if successful, or an error message if
-            an exception occurs.
+            and CartItem data if successful, or the validation errors
+            with a 400 status.
     """
     write_serializer = CartItemWriteSerializer(data=request.data)
     if write_serializer.is_valid():
         cart_item = write_serializer.save()
+        CartItemSerializer.prefetch_objects([cart_item])
         read_serializer = CartItemSerializer(cart_item)
         return Response({
             "message": "Dish added to cart successfully",
@@ -84,6 +100,7 @@ def product_in_cart(request):
     )
 
 
+@cache_control(private=True, max_age=5)
 @api_view(['GET'])
 def get_cart_stat(request):
     """
@@ -92,10 +109,12 @@ def get_cart_stat(request):
     This view expects a 'cart_code' parameter in the request's query
     parameters. If the cart code is present and a cart with that code
     exists, it returns the serialized cart data with a 200 OK status.
+    The payload is cached per cart code until the cart's items change,
+    and carries an ETag so a matching If-None-Match gets a 304; clients
+    may also reuse a response for a few seconds without asking.
     If the cart code is missing, it returns a 400 Bad Request with an
     appropriate message. If the cart does not exist, it returns a 404
-    Not Found. Any other exceptions are caught and returned as a 400
-    Bad Request.
+    Not Found. A malformed cart code is returned as a 400 Bad Request.
 
     Args:
         request (Request): The HTTP request object containing query
@@ -111,14 +130,32 @@ def get_cart_stat(request):
             return Response({
                 'message': 'Cart code not provided'
             }, status=status.HTTP_400_BAD_REQUEST)
-        cart = Cart.objects.get(cart_code=cart_code)
-        serializer = SimpleCartSerializer(cart)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    except Cart.DoesNotExist:
+        cache_key = cart_stat_cache_key(cart_code)
+        data = cache.get(cache_key)
+        if data is None:
+            # Read-only, so skip the serializer and build the payload from
+            # one row with the item quantities summed in SQL.
+            data = serialize_cart_stat_fast(
+                Cart.objects.filter(cart_code=cart_code)
+            )
+            if data is None:
+                return Response(
+                    {'message': 'Cart not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            cache.set(cache_key, data, timeout=CART_STAT_CACHE_TIMEOUT)
+
+        # The payload is just these values, so they identify it exactly.
+        etag = f'"{data["id"]}-{data["number_of_items"]}"'
+        if etag in request.headers.get('If-None-Match', ''):
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag}
+            )
         return Response(
-            {'message': 'Cart not found'}, status=status.HTTP_404_NOT_FOUND
+            data, status=status.HTTP_200_OK, headers={'ETag': etag}
         )
-    except Exception as e:
+    except ValueError as e:
+        # Raised by cart_stat_cache_key for a malformed cart code
         return Response({
             'message': str(e)
         }, status=status.HTTP_400_BAD_REQUEST)
@@ -130,14 +167,13 @@ def get_cart_item(request):
     Retrieve a specific cart item for a given cart and dish.
 
     This view expects 'cart_code' and 'dish_id' as query parameters in
-    the request. It fetches the cart using the provided cart code
-    (ensuring the cart is not paid), and retrieves the dish using the
-    provided dish ID. If both exist, it attempts to find the
-    corresponding CartItem linking the cart and dish. If found, it
-    returns the serialized CartItem data with a 200 OK status. If the
-    CartItem does not exist, it returns a 404 Not Found with an
-    appropriate message. If either parameter is missing, it returns a
-    400 Bad Request.
+    the request. It looks up, in a single query, the CartItem linking
+    the unpaid cart with the given cart code and the dish with the
+    given ID. If found, it returns the serialized CartItem data with a
+    200 OK status. If the cart, the dish or the CartItem does not
+    exist, it returns a 404 Not Found with an appropriate message. If
+    either parameter is missing or malformed, it returns a 400 Bad
+    Request.
 
     Args:
         request (Request): The HTTP request object containing
@@ -158,10 +194,11 @@ def get_cart_item(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        cart = get_object_or_404(Cart, cart_code=cart_code, paid=False)
-        dish = get_object_or_404(Dish, id=dish_id)
-
-        cart_item = CartItem.objects.get(cart=cart, dish=dish)
+        # One lookup through the joins instead of fetching the cart and
+        # dish first just to validate them.
+        cart_item = CartItemSerializer.prefetch_queryset().get(
+            cart__cart_code=cart_code, cart__paid=False, dish_id=dish_id
+        )
 
         serializer = CartItemSerializer(cart_item)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -170,11 +207,19 @@ def get_cart_item(request):
             {'message': 'Item not in cart'},
             status=status.HTTP_404_NOT_FOUND
         )
+    except (ValueError, ValidationError) as e:
+        # Malformed cart code or dish id
+        message = e.messages if isinstance(e, ValidationError) else str(e)
+        return Response(
+            {'error': message}, status=status.HTTP_400_BAD_REQUEST
+        )
 
 
 @api_view(['PATCH', 'PUT'])
 def update_item(request, cartItemId):
-    cart_item = get_object_or_404(CartItem, id=cartItemId)
+    cart_item = get_object_or_404(
+        CartItem.objects.select_related('dish', 'cart'), id=cartItemId
+    )
     update_serializer = CartItemUpdateWriteSerializer(
         cart_item,
         data=request.data,
@@ -183,6 +228,7 @@ def update_item(request, cartItemId):
 
     if update_serializer.is_valid():
         updated_item = update_serializer.save()
+        CartItemSerializer.prefetch_objects([updated_item])
         read_serializer = CartItemSerializer(updated_item)
         return Response({
             'message': 'Cart Item Updated Successfully',
@@ -0,0 +1,36 @@
+"""
+Phone number normalization shared by the account, bookings and contact apps.
+
+Numbers are stored in one canonical form (digits with an optional leading
+`+`) so equal numbers compare equal and indexed lookups/prefix searches on
+the column work without `LIKE '%...%'` scans.
+"""
+import re
+from rest_framework import serializers
+
+# Formatting characters people commonly type between digits.
+_SEPARATORS = re.compile(r'[\s\-().]')
+_NORMALIZED = re.compile(r'^\+?\d{7,15}$')
+
+
+def normalize_phone_number(value):
+    """
+    Strips formatting from a phone number.
+
+    Args:
+        value (str): The phone number as typed, e.g. '+234 (802) 372-8690'.
+
+    Returns:
+        str: The number as digits with an optional leading '+',
+            e.g. '+2348023728690'.
+
+    Raises:
+        serializers.ValidationError: If what remains is not a plausible
+            phone number (7 to 15 digits, per E.164).
+    """
+    normalized = _SEPARATORS.sub('', value or '')
+    if normalized.startswith('00'):
+        normalized = f'+{normalized[2:]}'
+    if not _NORMALIZED.match(normalized):
+        raise serializers.ValidationError('Enter a valid phone number.')
+    return normalized
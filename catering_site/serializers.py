@@ -0,0 +1,34 @@
+"""
+Shared serializer helpers for the catering site API.
+
+Classes:
+    CachedFieldsMixin: Builds a serializer's fields once per class instead
+        of on every instantiation.
+"""
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Caches the result of `get_fields()` on the serializer class.
+
+    `ModelSerializer.get_fields()` walks the model's `_meta` and builds
+    every field from scratch each time a serializer is instantiated, even
+    though the result only depends on the class. The unbound fields are
+    built once and stored on the class; every instance then receives its
+    own deep copy to bind, the same way DRF copies declared fields, so
+    per-request state such as `parent` and `context` is never shared.
+
+    Mix in before the DRF base class:
+        class AccountSerializer(CachedFieldsMixin, ModelSerializer): ...
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # Look in the class's own namespace so subclasses with a different
+        # Meta build their own cache instead of inheriting the parent's.
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
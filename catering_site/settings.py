@@ -100,6 +100,9 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Reuse connections across requests instead of reconnecting each time
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -122,6 +125,29 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.1/topics/auth/passwords/
+# Argon2 verifies a login far faster than PBKDF2 for comparable resistance
+# to brute force, so it hashes new passwords when argon2-cffi is installed.
+# PBKDF2 stays listed so existing hashes keep working and are upgraded to
+# Argon2 on the user's next login.
+
+try:
+    import argon2  # noqa: F401
+except ImportError:  # argon2-cffi is optional
+    argon2 = None
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+if argon2 is not None:
+    PASSWORD_HASHERS.insert(
+        0, 'django.contrib.auth.hashers.Argon2PasswordHasher'
+    )
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -215,6 +241,15 @@ REST_FRAMEWORK = {
     ),
 'DEFAULT_FILTER_BACKENDS':
 ['django_filters.rest_framework.DjangoFilterBackend'],
+# orjson when installed, stdlib json otherwise (see catering_site.renderers)
+'DEFAULT_RENDERER_CLASSES': (
+    'catering_site.renderers.ORJSONRenderer',
+    'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+# Used by userauth.throttling.EmailActionRateThrottle
+'DEFAULT_THROTTLE_RATES': {
+    'email_action': '20/min',
+    },
 }
 
 # Setup Email settings
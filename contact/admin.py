@@ -12,6 +12,7 @@ This module registers the Contact model with custom display options, including:
 Author: [Your Name]
 """
 from django.contrib import admin
+from django.db.models.functions import Substr
 from .models import Contact
 
 
@@ -40,15 +41,28 @@ class ContactAdmin(admin.ModelAdmin):
     )
     list_filter = ['created_at']
 
+    def get_queryset(self, request):
+        """
+        Cut the message down to its first 50 characters in the database and
+        leave the full text out of the query, so the changelist doesn't pull
+        every message body over the wire just to show a preview.
+        """
+        return (
+            super().get_queryset(request)
+            .annotate(message_short=Substr('message', 1, 50))
+            .defer('message')
+        )
+
     def short_message(self, obj):
         """
         Returns a shortened version of the message attribute from the given
         object,
         limited to the first 50 characters followed by ellipsis.
         Args:
-            obj: The object containing the 'message' attribute.
+            obj: The object carrying the 'message_short' annotation added
+                by `get_queryset`.
         Returns:
             str: A truncated message string ending with '...'.
         """
-        return f'{obj.message[:50]}...'
+        return f'{obj.message_short}...'
     short_message.short_description = 'Message'
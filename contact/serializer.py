@@ -6,6 +6,7 @@ including validation and transformation
 for API requests and responses.
 """
 from rest_framework import serializers
+from catering_site.phone_numbers import normalize_phone_number
 from .models import Contact
 
 
@@ -28,3 +29,6 @@ class ContactSerializer(serializers.ModelSerializer):
             'subject',
             'message'
         ]
+
+    def validate_phone_number(self, value):
+        return normalize_phone_number(value)
@@ -38,6 +38,13 @@ class DishAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
     filter_horizontal = ('allowed_extras',)
 
+    def get_queryset(self, request):
+        """
+        Join each dish's category into the changelist query, since
+        `category` is shown in `list_display`.
+        """
+        return super().get_queryset(request).select_related('category')
+
     fieldsets = (
         ("Dish Information", {
             "fields": (
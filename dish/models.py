@@ -97,6 +97,8 @@ class Dish(models.Model):
     Meta:
         verbose_name_plural (str): The plural name for the model in the admin
             interface is set to 'Dishes'.
+        indexes (list): Indexes on `is_available` and
+            (`category`, `is_available`) for the availability filters.
     """
     name = models.CharField(max_length=100, unique=True)
     slug = models.SlugField(unique=True, blank=True)
@@ -120,16 +122,42 @@ class Dish(models.Model):
         ExtraCategory, blank=True, related_name='dishes'
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the category the row was loaded with, so the cache
+        handlers in dish.signals can tell when a dish changes category.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'category_id' in field_names:
+            instance._loaded_category_id = values[
+                field_names.index('category_id')
+            ]
+        return instance
+
     def save(self, *args, **kwargs):
         """
         Auto-generates a slug from the dish name if not already provided.
+        When a slug is generated during a partial save, it is added to
+        `update_fields` so it is written along with the requested fields.
         """
-        if not self.slug:
+        if not self.slug and self.name:
             self.slug = slugify(self.name)
-        return super().save(*args, **kwargs)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'slug' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'slug']
+        result = super().save(*args, **kwargs)
+        self._loaded_category_id = self.category_id
+        return result
 
     class Meta:
         verbose_name_plural = 'Dishes'
+        # Back the is_available filter on the list views and the
+        # per-category lookups (pairings, detail). slug is already unique.
+        indexes = [
+            models.Index(fields=['is_available']),
+            models.Index(fields=['category', 'is_available']),
+        ]
 
     def __str__(self):
         return self.name
@@ -5,18 +5,25 @@ Serializers for the Dish model.
 
 This module defines the serializer for the Dish model to handle
 data validation, transformation, and representation for API
-requests and responses.
+requests and responses. List endpoints use the flat
+`DishListSerializer`; `DishSerializer` keeps the nested category.
 """
 
+import random
+
 from rest_framework import serializers
+from catering_site.serializers import CachedFieldsMixin
 from .models import Dish, ExtraItem, ExtraCategory
 from foodCategory.serializers import CategorySerializer
 from dish.models import Dish
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db.models import QuerySet
 from review.serializers import ReviewSerializer
 
+PAIRING_IDS_CACHE_TIMEOUT = 60
+
 
-class DishSerializer(serializers.ModelSerializer):
+class DishSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Dish model.
 
@@ -34,13 +41,102 @@ class DishSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at', 'slug']
 
 
-class ExtraItemsSerializer(serializers.ModelSerializer):
+class DishListListSerializer(serializers.ListSerializer):
+    """
+    List serializer for DishListSerializer. A queryset is read with a single
+    `.values()` query and each row is turned into the child's payload with
+    the child's bound fields, so no Dish or Category instance is built and
+    no per-row field descent runs. Anything that isn't a queryset (a list
+    of dishes, a related manager) goes through the regular path.
+    """
+    values_fields = (
+        'id', 'name', 'slug', 'image', 'category__slug', 'category__name',
+        'is_available', 'created_at', 'updated_at', 'price',
+    )
+
+    def to_representation(self, data):
+        if not isinstance(data, QuerySet):
+            return super().to_representation(data)
+        fields = self.child.fields
+        created_at = fields['created_at'].to_representation
+        updated_at = fields['updated_at'].to_representation
+        price = fields['price'].to_representation
+        storage = Dish._meta.get_field('image').storage
+        request = self.context.get('request')
+
+        def image_url(name):
+            # Mirrors serializers.ImageField for a stored file name.
+            if not name:
+                return None
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request else url
+
+        return [
+            {
+                'id': row['id'],
+                'name': row['name'],
+                'slug': row['slug'],
+                'image': image_url(row['image']),
+                'category_slug': row['category__slug'],
+                'category_name': row['category__name'],
+                'is_available': row['is_available'],
+                'created_at': created_at(row['created_at']),
+                'updated_at': updated_at(row['updated_at']),
+                'price': price(row['price']),
+            }
+            for row in data.values(*self.values_fields)
+        ]
+
+
+class DishListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Flat serializer for Dish rows on list endpoints.
+
+    Exposes the category as `category_slug` and `category_name` instead of
+    nesting the full CategorySerializer for every row. The full `description`
+    is left out; the detail endpoint returns it. Pair it with
+    `DishListSerializer.prefetch_queryset` so the category is joined.
+    """
+    category_slug = serializers.CharField(
+        source='category.slug', read_only=True
+    )
+    category_name = serializers.CharField(
+        source='category.name', read_only=True
+    )
+
+    class Meta:
+        model = Dish
+        fields = [
+            'id', 'name', 'slug', 'image', 'category_slug', 'category_name',
+            'is_available', 'created_at', 'updated_at', 'price',
+        ]
+        list_serializer_class = DishListListSerializer
+
+    @classmethod
+    def prefetch_queryset(cls, queryset=None):
+        """
+        Joins the category and loads only the columns this serializer reads.
+        Args:
+            queryset (QuerySet, optional): The Dish queryset to narrow.
+                Defaults to all dishes.
+        Returns:
+            QuerySet: The queryset ready for list serialization.
+        """
+        if queryset is None:
+            queryset = Dish.objects.all()
+        return queryset.select_related('category').only(
+            'id', 'name', 'slug', 'image', 'is_available', 'price',
+            'created_at', 'updated_at', 'category__slug', 'category__name',
+        )
+
+
+class ExtraItemsSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ExtraItem
         fields = '__all__'
 
 
-class ExtraCategorySerializer(serializers.ModelSerializer):
+class ExtraCategorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     extras = ExtraItemsSerializer(many=True, read_only=True)
 
     class Meta:
@@ -51,8 +147,9 @@ class ExtraCategorySerializer(serializers.ModelSerializer):
 class DishDetailSerializer(serializers.ModelSerializer):
     allowed_extras = ExtraCategorySerializer(many=True, read_only=True)
     category = CategorySerializer(read_only=True)
-    average_rating = serializers.SerializerMethodField()
-    total_reviews = serializers.SerializerMethodField()
+    # Annotated on the queryset by the view (Avg / Count over reviews).
+    average_rating = serializers.FloatField(read_only=True)
+    total_reviews = serializers.IntegerField(read_only=True)
     reviews = ReviewSerializer(many=True, read_only=True)
     suggested_pairings = serializers.SerializerMethodField()
 
@@ -64,42 +161,39 @@ class DishDetailSerializer(serializers.ModelSerializer):
             'average_rating', 'total_reviews', 'reviews', 'suggested_pairings'
         ]
 
-    def get_average_rating(self, obj):
-        reviews = obj.reviews.all()
-        if reviews.exists():
-            return reviews.aggregate(average=Avg('rating'))['average']
-        return None
-
-    def get_total_reviews(self, obj):
-        """
-        Returns the total number of reviews associated with the given object.
-        Args:
-            obj: The object instance for which the total number of reviews is
-                calculated.
-                It is expected that this object has a related 'reviews'
-                manager with a 'count()' method.
-        Returns:
-            int: The total count of reviews for the specified object.
-        """
-        total = obj.reviews.count()
-        return total
-
     def get_suggested_pairings(self, obj):
         """
-        Returns a list of up to three randomly selected dishes from the same
-        category as the given dish, excluding the dish itself. If the dish has
-        no category, returns an empty list.
+        Returns a list of up to three randomly selected available dishes from
+        the same category as the given dish, excluding the dish itself. If the
+        dish has no category, returns an empty list.
+        The IDs of the category's available dishes are cached for
+        `PAIRING_IDS_CACHE_TIMEOUT` seconds and sampled in Python, so only
+        the picked dishes are fetched instead of randomly ordering the whole
+        category in the database. Each pairing keeps the full
+        `DishSerializer` payload, nested category and description included.
         Args:
             obj (Dish): The dish instance for which to suggest pairings.
         Returns:
             list: A list of serialized dish data repping suggested pairings.
         """
-        if not obj.category:
+        if not obj.category_id:
+            return []
+        cache_key = f'pairing_ids:{obj.category_id}'
+        ids = cache.get(cache_key)
+        if ids is None:
+            ids = list(
+                Dish.objects
+                .filter(category_id=obj.category_id, is_available=True)
+                .values_list('id', flat=True)
+            )
+            cache.set(cache_key, ids, timeout=PAIRING_IDS_CACHE_TIMEOUT)
+        candidates = [dish_id for dish_id in ids if dish_id != obj.id]
+        if not candidates:
             return []
+        picked = random.sample(candidates, min(3, len(candidates)))
         suggestions = (
             Dish.objects
-            .filter(category=obj.category)
-            .exclude(id=obj.id)
-            .order_by('?')[:3]  # returns 3 random suggestions
+            .filter(id__in=picked)
+            .select_related('category')
         )
         return DishSerializer(suggestions, many=True).data
@@ -0,0 +1,56 @@
+"""
+dish.signals
+------------
+Keeps the cached dish payloads in step with the database.
+
+The featured-dish list embeds each dish's category, so any Dish or
+Category save or delete drops it once the transaction commits, and the
+next read rebuilds it. Dish changes also drop the cached pairing IDs of
+the dish's category, and of its previous category when it moved.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from foodCategory.models import Category
+
+from .models import Dish
+from .views import AVAILABLE_DISHES_CACHE_KEY
+
+
+def invalidate_dish_caches(category_ids=()):
+    """
+    Drops the cached list of available dishes, and the cached pairing IDs
+    of the given categories, once the current transaction commits, so a
+    concurrent request can't re-cache the pre-commit rows.
+    Args:
+        category_ids (iterable): IDs of the categories whose pairing IDs
+            are stale. None entries are ignored.
+    """
+    keys = [AVAILABLE_DISHES_CACHE_KEY] + [
+        f'pairing_ids:{category_id}'
+        for category_id in set(category_ids) if category_id is not None
+    ]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+@receiver(post_save, sender=Dish)
+@receiver(post_delete, sender=Dish)
+def invalidate_dish_caches_for_dish(sender, instance, raw=False, **kwargs):
+    # Fixture loading saves raw rows; the caches are rebuilt on first read.
+    if raw:
+        return
+    invalidate_dish_caches((
+        instance.category_id,
+        getattr(instance, '_loaded_category_id', None),
+    ))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_dish_caches_for_category(sender, instance, raw=False,
+                                        **kwargs):
+    if raw:
+        return
+    invalidate_dish_caches()
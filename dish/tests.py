@@ -1,3 +1,30 @@
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from foodCategory.models import Category
+
+from .models import Dish
+
+
+class DishCacheInvalidationTests(TestCase):
+    """
+    Dish writes drop the cached pairing IDs of every category involved.
+    """
+
+    def setUp(self):
+        self.old = Category.objects.create(name='Soups')
+        self.new = Category.objects.create(name='Swallow')
+        self.dish = Dish.objects.create(
+            name='Egusi', description='Melon soup', price=10,
+            category=self.old,
+        )
+        self.dish = Dish.objects.get(pk=self.dish.pk)
+
+    def test_moving_a_dish_drops_both_categories_pairings(self):
+        cache.set(f'pairing_ids:{self.old.id}', [self.dish.id])
+        cache.set(f'pairing_ids:{self.new.id}', [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dish.category = self.new
+            self.dish.save()
+        self.assertIsNone(cache.get(f'pairing_ids:{self.old.id}'))
+        self.assertIsNone(cache.get(f'pairing_ids:{self.new.id}'))
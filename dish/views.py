@@ -16,38 +16,60 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
 from .models import Dish
-from .serializer import DishSerializer, DishDetailSerializer
+from .serializer import DishListSerializer, DishDetailSerializer
 from django.core.cache import cache
 import random
 import logging
+from django.db.models import Avg, Count
 from django.shortcuts import get_object_or_404
 
 # Creates a logger named after the current Python module.
 # If your file is called views.py, the logger name becomes yourapp.views
 logger = logging.getLogger(__name__)
 
+AVAILABLE_DISHES_CACHE_KEY = 'available_dishes_serialized'
+# Dish and Category changes rebuild the entry (see dish.signals), so the
+# timeout only bounds staleness from writes that bypass signals.
+AVAILABLE_DISHES_CACHE_TIMEOUT = 60 * 60
+
+
+def rebuild_available_dish_data():
+    """
+    Serialize every available dish and store the list in cache for an hour.
+
+    Called on a cache miss. dish.signals drops the cached list after every
+    Dish or Category write, so the next read rebuilds it from committed
+    rows.
+
+    Returns:
+        list: Serialized list of available dishes.
+    """
+    queryset = DishListSerializer.prefetch_queryset(
+        Dish.objects.filter(is_available=True)
+    )
+    data = DishListSerializer(queryset, many=True).data
+    cache.set(
+        AVAILABLE_DISHES_CACHE_KEY, data,
+        timeout=AVAILABLE_DISHES_CACHE_TIMEOUT
+    )
+    return data
+
 
 def cache_available_dish_data():
     """
     Retrieve serialized data of available dishes from cache,
-    or query the database and store the result in cache for 30 seconds.
+    rebuilding it from the database on a miss.
+
+    The full list is cached, however short, so callers can draw a fresh
+    random sample from it on every request.
 
     Returns:
         list: Serialized list of available dishes.
     """
-    featured = cache.get('available_dish_data')
-    if featured is None:
-        queryset = Dish.objects.filter(is_available=True)
-        serializer = DishSerializer(queryset, many=True)
-        data = serializer.data
-
-        if len(data) > 3:
-            featured = random.sample(data, 3)
-            cache.set('available_dish_data', featured, timeout=300)
-            return featured
-        else:
-            featured = None
-    return featured
+    data = cache.get(AVAILABLE_DISHES_CACHE_KEY)
+    if data is None:
+        data = rebuild_available_dish_data()
+    return data
 
 
 @api_view(['GET'])
@@ -64,21 +86,21 @@ def random_featured_dish(request):
     try:
         dishes = cache_available_dish_data()
 
-        if not dishes:
+        if len(dishes) < 3:
             return Response(
                 {"Message": "Not enough dishes to feature."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # featured_dishes = random.sample(dishes, 3)
-        logger.info("Cache hit: Retrieved featured dishes from cache.")
-        # Log the cache hit
-        return Response(dishes)
+        featured_dishes = random.sample(dishes, 3)
+        return Response(featured_dishes)
 
     except Exception:
         logger.exception("Error retrieving cached dishes")
-        queryset = Dish.objects.filter(is_available=True)[:3]
-        serializer = DishSerializer(queryset, many=True)
+        queryset = DishListSerializer.prefetch_queryset(
+            Dish.objects.filter(is_available=True)
+        )[:3]
+        serializer = DishListSerializer(queryset, many=True)
         return Response(serializer.data)
 
 
@@ -98,8 +120,10 @@ def dish_list(request):
         Response: A response object containing serialized data of
         available dishes.
     """
-    available_dishes = Dish.objects.filter(is_available=True)
-    serializer = DishSerializer(available_dishes, many=True)
+    available_dishes = DishListSerializer.prefetch_queryset(
+        Dish.objects.filter(is_available=True)
+    )
+    serializer = DishListSerializer(available_dishes, many=True)
     return Response(serializer.data)
 
 
@@ -116,8 +140,17 @@ def dish_detail_view(request, category_slug, slug):
             HTTP 200 OK status if the dish is found and available. Raises a
             404 error if the dish does not exist or is not available.
     """
+    # Load everything the detail serializer reads up-front, with the
+    # review stats computed alongside the dish row.
+    queryset = Dish.objects.select_related('category').prefetch_related(
+        'reviews__user',
+        'allowed_extras__extras',
+    ).annotate(
+        average_rating=Avg('reviews__rating'),
+        total_reviews=Count('reviews'),
+    )
     dish = get_object_or_404(
-        Dish,
+        queryset,
         slug=slug,
         category__slug=category_slug,
         is_available=True
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FoodcategoryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'foodCategory'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -22,29 +22,51 @@ class Category(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the name the row was loaded with, so `save` can tell
+        whether it changed without fetching the row again.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'name' in field_names:
+            instance._loaded_name = values[field_names.index('name')]
+        return instance
+
     def save(self, *args, **kwargs):
         """
         Automatically generates a unique slug if not provided,
         or if the name changes during updates.
+        Collisions are resolved with one query for every slug that shares
+        the base slug, and the next free suffix is picked in Python.
         """
         slug_value = self.slug
         if not slug_value:
             slug_value = slugify(self.name)
         elif self.id:
-            original = Category.objects.get(id=self.id)
-            if original.name != self.name:
+            original_name = getattr(self, '_loaded_name', None)
+            if original_name is None:
+                original_name = Category.objects.filter(
+                    id=self.id
+                ).values_list('name', flat=True).first()
+            if original_name != self.name:
                 slug_value = slugify(self.name)
 
         base_slug = slug_value
+        taken = set(
+            Category.objects.filter(slug__startswith=base_slug)
+            .exclude(id=self.id)
+            .values_list('slug', flat=True)
+        )
         counter = 1
-        while Category.objects.filter(
-            slug=slug_value
-        ).exclude(id=self.id).exists():
+        while slug_value in taken:
             slug_value = f'{base_slug}-{counter}'
             counter += 1
 
         self.slug = slug_value
-        return super().save(*args, **kwargs)
+        result = super().save(*args, **kwargs)
+        self._loaded_name = self.name
+        return result
 
     def __str__(self):
         return self.name
@@ -52,5 +74,6 @@ class Category(models.Model):
     class Meta:
         verbose_name_plural = 'Categories'
         indexes = [
-            models.Index(fields=['slug'])
+            models.Index(fields=['slug']),
+            models.Index(fields=['is_active']),
         ]
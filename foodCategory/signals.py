@@ -0,0 +1,20 @@
+"""
+foodCategory.signals
+--------------------
+Drops the cached active-category list whenever a Category is saved or
+deleted, including the create done by `category_list_create`'s POST, admin
+edits and shell changes.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Category
+from .views import ACTIVE_CATEGORIES_CACHE_KEY
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_active_categories(sender, instance, **kwargs):
+    transaction.on_commit(lambda: cache.delete(ACTIVE_CATEGORIES_CACHE_KEY))
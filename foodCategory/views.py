@@ -7,19 +7,29 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from .models import Category
-from .serializers import CategorySerializer
+from django.core.cache import cache
+from .serializers import CategorySerializer, serialize_categories_fast
+
+ACTIVE_CATEGORIES_CACHE_KEY = 'categories:active'
+ACTIVE_CATEGORIES_CACHE_TIMEOUT = 300
 
 
 @api_view(['GET', 'POST'])
 def category_list_create(request):
     """
-    GET: Return a list of active categories.
+    GET: Return a list of active categories, cached for five minutes.
     POST: Allow staff users to create a new category.
     """
     if request.method == 'GET':
-        categories = Category.objects.filter(is_active=True)
-        serializer = CategorySerializer(categories, many=True)
-        return Response(serializer.data)
+        data = cache.get(ACTIVE_CATEGORIES_CACHE_KEY)
+        if data is None:
+            categories = Category.objects.filter(is_active=True)
+            data = serialize_categories_fast(categories)
+            cache.set(
+                ACTIVE_CATEGORIES_CACHE_KEY, data,
+                timeout=ACTIVE_CATEGORIES_CACHE_TIMEOUT
+            )
+        return Response(data)
 
     if request.method == 'POST':
         if not request.user.is_authenticated or not request.user.is_staff:
@@ -24,6 +24,16 @@ class Review(models.Model):
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-created_at']
+        # Backs a dish's newest-first review list.
+        indexes = [
+            models.Index(
+                fields=['dish', '-created_at'],
+                name='review_dish_created_idx'
+            ),
+        ]
+
     def __str__(self):
         return f'{self.user} on {self.dish} ({self.rating}★)'
 
@@ -1,11 +1,12 @@
 from rest_framework import serializers
+from catering_site.serializers import CachedFieldsMixin
 from .models import Review
 from django.contrib.auth import get_user_model
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     user = serializers.StringRelatedField() # uses __str__ of the user model
-    dish = serializers.StringRelatedField() # uses __str__ of the dish model
+    dish = serializers.CharField(source='dish.name', read_only=True)
     class Meta:
         model = Review
         fields = [
@@ -15,10 +16,69 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only_fields = [
             'id', 'user', 'created_at'
         ]
-    
-    def validate_rating(self, value):
-        if value < 1 or value > 5:
-            raise serializers.ValidationError(
-                'Rating must be between 1 and 5'
-            )
-        return value
+
+    def to_representation(self, instance):
+        """
+        Builds the output dict directly instead of dispatching through each
+        bound field, with the same values as the declared fields: the
+        user's and dish's string forms and the formatted timestamp. The
+        dish detail page nests this once per review.
+        """
+        return {
+            'id': instance.id,
+            'user': str(instance.user),
+            'dish': instance.dish.name,
+            'rating': instance.rating,
+            'comment': instance.comment,
+            'created_at': self.fields['created_at'].to_representation(
+                instance.created_at
+            ),
+        }
+
+
+_datetime_field = serializers.DateTimeField()
+
+
+def dish_review_rows(dish):
+    """
+    Returns a `.values()` queryset of a dish's reviews, newest first, with
+    the columns `serialize_dish_reviews_fast` reads.
+    Args:
+        dish (Dish): The dish whose reviews are read.
+    Returns:
+        QuerySet: One dict per review.
+    """
+    return dish.reviews.order_by('-created_at').values(
+        'id', 'user__first_name', 'user__last_name', 'rating', 'comment',
+        'created_at'
+    )
+
+
+def serialize_dish_reviews_fast(dish, rows=None):
+    """
+    Serializes a dish's reviews, newest first, to the same payload as
+    `ReviewSerializer(many=True)` from `.values()` rows, so no Review or
+    Account instance is built and no serializer field is bound.
+    Args:
+        dish (Dish): The dish whose reviews are serialized.
+        rows (iterable, optional): Rows from `dish_review_rows`, e.g. one
+            page of them. Defaults to all of the dish's reviews.
+    Returns:
+        list: One dict per review.
+    """
+    if rows is None:
+        rows = dish_review_rows(dish)
+    return [
+        {
+            'id': row['id'],
+            # Account.__str__
+            'user': f"{row['user__first_name']} {row['user__last_name']}",
+            'dish': dish.name,
+            'rating': row['rating'],
+            'comment': row['comment'],
+            'created_at': _datetime_field.to_representation(
+                row['created_at']
+            ),
+        }
+        for row in rows
+    ]
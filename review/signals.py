@@ -0,0 +1,21 @@
+"""
+review.signals
+--------------
+Drops a dish's cached first review page whenever one of its reviews is
+saved or deleted, including the create done by `dish_review`'s POST,
+admin edits and shell changes.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Review
+from .views import dish_reviews_cache_key
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_dish_reviews(sender, instance, **kwargs):
+    cache_key = dish_reviews_cache_key(instance.dish_id)
+    transaction.on_commit(lambda: cache.delete(cache_key))
@@ -1,3 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from dish.models import Dish
+from foodCategory.models import Category
+
+from .models import Review
+from .serializers import ReviewSerializer
+from .views import dish_reviews_cache_key
+
+
+class ReviewSerializerRatingTests(TestCase):
+    """
+    The rating range comes from the model's Min/MaxValueValidator, which
+    ModelSerializer maps onto the rating field.
+    """
+
+    def test_rating_out_of_range_is_rejected(self):
+        for rating in (0, 6):
+            serializer = ReviewSerializer(
+                data={'rating': rating, 'comment': 'Nice'}
+            )
+            self.assertFalse(serializer.is_valid())
+            self.assertIn('rating', serializer.errors)
+
+    def test_rating_in_range_is_accepted(self):
+        for rating in (1, 5):
+            serializer = ReviewSerializer(
+                data={'rating': rating, 'comment': 'Nice'}
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+
+class DishReviewCacheInvalidationTests(TestCase):
+    """
+    Any Review write, not just the view's POST, drops the dish's cached
+    first review page.
+    """
+
+    def setUp(self):
+        category = Category.objects.create(name='Soups')
+        self.dish = Dish.objects.create(
+            name='Egusi', description='Melon soup', price=10,
+            category=category,
+        )
+        self.user = get_user_model().objects.create(email='a@example.com')
+        self.key = dish_reviews_cache_key(self.dish.pk)
+
+    def test_save_and_delete_drop_cached_page(self):
+        cache.set(self.key, {'results': [], 'next_cursor': None})
+        with self.captureOnCommitCallbacks(execute=True):
+            review = Review.objects.create(
+                dish=self.dish, user=self.user, rating=4, comment='Nice'
+            )
+        self.assertIsNone(cache.get(self.key))
+
+        cache.set(self.key, {'results': [], 'next_cursor': None})
+        with self.captureOnCommitCallbacks(execute=True):
+            review.delete()
+        self.assertIsNone(cache.get(self.key))
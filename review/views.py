@@ -5,18 +5,100 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from dish.models import Dish
 from review.models import Review
 from rest_framework import status
-from .serializers import ReviewSerializer
+from django.core.cache import cache
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+from urllib.parse import parse_qs, urlsplit
+from .serializers import (
+    ReviewSerializer, dish_review_rows, serialize_dish_reviews_fast
+)
+
 # Create your views here.
 
+DISH_REVIEWS_CACHE_TIMEOUT = 60
+
+
+def dish_reviews_cache_key(dish_id):
+    """
+    Returns the cache key of a dish's cached first review page.
+    Args:
+        dish_id (int): The primary key of the reviewed dish.
+    Returns:
+        str: The cache key.
+    """
+    return f'dish_reviews_page:{dish_id}'
+
+
+class ReviewCursorPagination(CursorPagination):
+    """
+    Pages a dish's reviews newest first, 20 at a time. The cursor filters
+    on `created_at`, so each page is a bounded range read on the
+    (dish, -created_at) index instead of the whole review list.
+    """
+    ordering = '-created_at'
+    page_size = 20
+
+    def get_next_cursor(self):
+        """
+        Returns the encoded cursor of the next page, or None on the last
+        page. The cursor doesn't depend on the request's host, so it can be
+        cached and shared across requests.
+        """
+        link = self.get_next_link()
+        if link is None:
+            return None
+        return parse_qs(urlsplit(link).query)[self.cursor_query_param][0]
+
+    @classmethod
+    def build_first_page(cls, request, results, next_cursor):
+        """
+        Builds the first page's response body from cached results and
+        next cursor, with the `next` link built from this request's scheme
+        and host.
+        """
+        next_link = None
+        if next_cursor is not None:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), cls.cursor_query_param,
+                next_cursor
+            )
+        return {'next': next_link, 'previous': None, 'results': results}
+
+
 @api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticatedOrReadOnly])
 def dish_review(request, dish_slug):
-    dish = get_object_or_404(Dish, slug=dish_slug)
+    dish = get_object_or_404(Dish.objects.only('id', 'name'), slug=dish_slug)
 
     if request.method == 'GET':
-        reviews = dish.reviews.all().order_by('-created_at')
-        serializer = ReviewSerializer(reviews, many=True)
-        return Response(serializer.data)
+        # Only the first page is cached; it is what almost every
+        # visitor asks for, and a new review only ever changes it.
+        # review.signals drops it after any Review write.
+        first_page = ReviewCursorPagination.cursor_query_param not in (
+            request.query_params
+        )
+        if first_page:
+            # The absolute `next` URL is rebuilt per request rather than
+            # cached, so each client gets a link for its own host.
+            cached = cache.get(dish_reviews_cache_key(dish.pk))
+            if cached is not None:
+                return Response(ReviewCursorPagination.build_first_page(
+                    request, cached['results'], cached['next_cursor']
+                ))
+        paginator = ReviewCursorPagination()
+        rows = paginator.paginate_queryset(dish_review_rows(dish), request)
+        results = serialize_dish_reviews_fast(dish, rows)
+        response = paginator.get_paginated_response(results)
+        if first_page:
+            cache.set(
+                dish_reviews_cache_key(dish.pk),
+                {
+                    'results': results,
+                    'next_cursor': paginator.get_next_cursor(),
+                },
+                timeout=DISH_REVIEWS_CACHE_TIMEOUT
+            )
+        return response
     
        
     if request.method == 'POST':
@@ -4,3 +4,19 @@ from django.apps import AppConfig
 class UserAuthConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'userauth'
+
+    def ready(self):
+        # Build the configured password validators at startup. Django caches
+        # them per process, and CommonPasswordValidator reads and unzips its
+        # 20,000-word list when built, which would otherwise land on the
+        # first registration request.
+        from django.contrib.auth.password_validation import (
+            get_default_password_validators,
+        )
+        get_default_password_validators()
+
+        # Build the password hasher registry now instead of on the first
+        # register, login or password reset in each worker. argon2-cffi,
+        # when installed, is already imported by the settings module.
+        from django.contrib.auth.hashers import get_hasher
+        get_hasher()
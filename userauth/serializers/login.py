@@ -18,8 +18,6 @@ Raises:
         not verified.
 """
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.settings import api_settings
-from django.contrib.auth.models import update_last_login
 from account.serializers import AccountSerializer
 from rest_framework import serializers
 from django.contrib.auth import authenticate
@@ -44,9 +42,9 @@ class LoginSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         """
         Validates user login credentials and returns authentication tokens.
-        This method checks if the user exists and is verified. If validation
-        passes, it generates refresh and access tokens for the user, serialize
-        the user data, and updates the last login timestamp if configured.
+        This method checks if the user exists and is verified. The refresh
+        and access tokens, and the last login update if configured, come from
+        `TokenObtainPairSerializer.validate`; this adds the serialized user.
         Args:
             attrs (dict): The input data containing login credentials.
         Returns:
@@ -65,14 +63,9 @@ class LoginSerializer(TokenObtainPairSerializer):
         if not self.user.is_verified:
             raise serializers.ValidationError("Email is not verified.")
 
-        refresh = self.get_token(self.user) 
-        
-        # If using default username to login, just call super().validate
+        # super().validate already issued the refresh/access pair and
+        # updated last_login; issuing another pair would sign both tokens
+        # again and record a second OutstandingToken row for the blacklist.
         data['user'] = AccountSerializer(self.user).data
-        data['refresh'] = str(refresh)
-        data['access'] = str(refresh.access_token)
 
-        if api_settings.UPDATE_LAST_LOGIN:
-            update_last_login(None, self.user)
-        
         return data
@@ -7,12 +7,17 @@ Classes:
     RegisterSerializer: Serializer for registering new users, ensuring password
     confirmation and validation according to Django's password policies.
 """
+import logging
+from collections.abc import Mapping
+
 from rest_framework import serializers
 from account.models import Account
 from account.serializers import AccountSerializer
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class RegisterSerializer(AccountSerializer):
     """
@@ -44,6 +49,20 @@ class RegisterSerializer(AccountSerializer):
             'confirm_password'
         ]
 
+    def to_internal_value(self, data):
+        """
+        Normalizes the email the same way `create_user` stores it before
+        validation, so the uniqueness check compares like with like and a
+        differently cased domain can't slip past it into an IntegrityError.
+        Non-object bodies are passed straight to DRF, which rejects them
+        with its usual 400 "Expected a dictionary" error.
+        """
+        email = data.get('email') if isinstance(data, Mapping) else None
+        if isinstance(email, str):
+            data = data.copy()
+            data['email'] = Account.objects.normalize_email(email.strip())
+        return super().to_internal_value(data)
+
     def validate(self, attrs):
         """
         Validates the provided password and confirm_password fields.
@@ -89,11 +108,10 @@ class RegisterSerializer(AccountSerializer):
 
         Side Effects:
             Removes the 'confirm_password' field from the validated data
-            before creating the user.
-
-        Prints:
-            The validated data to the console for debugging purposes.
+            before creating the user. Logs the submitted field names (never
+            their values) at DEBUG level.
         """
-        print("VALIDATED DATA:", validated_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('validated data keys: %s', list(validated_data))
         validated_data.pop('confirm_password')
         return Account.objects.create_user(**validated_data)
@@ -1,3 +1,43 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
 
-# Create your tests here.
+
+class RegisterViewBodyTests(TestCase):
+    """
+    Registration must answer malformed bodies with a 400, not a 500.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('register-view')
+
+    def test_non_object_body_is_rejected(self):
+        for body in ([{'email': 'a@example.com'}], 'a@example.com'):
+            response = self.client.post(self.url, body, format='json')
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+            self.assertIn('non_field_errors', response.data)
+
+
+class EmailActionBodyTests(TestCase):
+    """
+    The resend and password reset endpoints answer a non-string email with
+    the same 400 as a missing one, not a 500.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_non_string_email_is_rejected(self):
+        for name in ('regen-token', 'reset-password-view'):
+            for email in (123, ['a@example.com'], {'a': 'b'}):
+                response = self.client.post(
+                    reverse(name), {'email': email}, format='json'
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST,
+                    (name, email)
+                )
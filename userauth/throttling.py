@@ -0,0 +1,21 @@
+"""
+Request throttles for the user authentication endpoints.
+
+Classes:
+    EmailActionRateThrottle: Per-client rate limit for the anonymous
+        endpoints that look up an account by email or verify an emailed
+        token.
+"""
+from rest_framework.throttling import AnonRateThrottle
+
+
+class EmailActionRateThrottle(AnonRateThrottle):
+    """
+    Limits how often one client address may call the email-driven endpoints
+    (resend verification, request a password reset, verify an email).
+
+    A throttled request gets a 429 before any database lookup, token
+    signing or email queuing. The counters live in the default Django cache,
+    and the rate is `DEFAULT_THROTTLE_RATES['email_action']`.
+    """
+    scope = 'email_action'
@@ -3,29 +3,67 @@ This module provides utility functions for sending emails,
 specifically for sending email verification links to users.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import smtplib
+import time
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Sends mail off the request thread; two workers keep SMTP connections
+# bounded under a burst of registrations.
+_mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='mail')
+MAIL_MAX_ATTEMPTS = 3
+
+# Links are built by appending the token to these bases.
+VERIFY_LINK_BASE = 'http://localhost:5173/verify/?token='
+RESET_LINK_BASE = 'http://localhost:8000/api/auth/reset-password/?token='
+
+
+def _deliver(subject, message, recipient_email):
+    """
+    Sends the email on a worker thread, retrying transient SMTP failures
+    with a doubling backoff and logging the final failure, since there is
+    no caller left to raise to.
+    """
+    for attempt in range(1, MAIL_MAX_ATTEMPTS + 1):
+        try:
+            send_mail(
+                subject=subject,
+                message=message,
+                from_email=settings.EMAIL_HOST_USER,
+                recipient_list=recipient_email,
+                fail_silently=False,
+            )
+            return
+        except (smtplib.SMTPException, OSError):
+            if attempt < MAIL_MAX_ATTEMPTS:
+                time.sleep(2 ** (attempt - 1))
+                continue
+            logger.exception('Failed to send email to %s', recipient_email)
+        except Exception:
+            logger.exception('Failed to send email to %s', recipient_email)
+            return
+
 
 def send_email(subject, message, recipient_email):
     """
-    Sends an email with the specified subject and message to the recipient.
+    Queues an email with the specified subject and message to the recipient.
+    The SMTP exchange runs on a background thread once the current
+    transaction commits, so the request doesn't wait on the mail server.
     Args:
         subject (str): The subject of the email.
         message (str): The body content of the email.
         recipient_email (list): The email address(es) of the recipient(s).
-    Raises:
-        Exception: If the email fails to send, an exception will be raised.
+    Failures are logged by `_deliver` rather than raised.
     """
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email=settings.EMAIL_HOST_USER,
-        recipient_list=recipient_email,
-        fail_silently=False,
+    transaction.on_commit(
+        lambda: _mail_executor.submit(
+            _deliver, subject, message, recipient_email
+        )
     )
 
 
@@ -42,13 +80,10 @@ def send_verification_email(user_email, token):
         click to verify their email address.
     """
     subject = 'Verify your email'
-    verification_link = (
-        f'http://localhost:5173/verify/?token={token}'
-    )
     message = (
-        f"Click the link to verify your email: {verification_link}"
+        f"Click the link to verify your email: {VERIFY_LINK_BASE}{token}"
     )
-    logger.info(f'Token for {user_email}: {token}')
+    logger.info('Token for %s: %s', user_email, token)
     send_email(subject, message, [user_email])
 
 
@@ -69,10 +104,7 @@ def send_password_reset_email(user_email, token):
         Sends an email to the user with a link to reset their password.
     """
     subject = 'Reset your password'
-    reset_link = (
-        f'http://localhost:8000/api/auth/reset-password/?token={token}'
-    )
     message = (
-        f"Click the link to reset your password: {reset_link}"
+        f"Click the link to reset your password: {RESET_LINK_BASE}{token}"
     )
     send_email(subject, message, [user_email])
@@ -4,8 +4,15 @@ This module provides utility functions for generating and verifying email\
 The tokens are used for email verification purposes.
 """
 
+from django.core.cache import cache
+
 from .token_manager import *
 
+EMAIL_TOKEN_MAX_AGE = 300
+# A cached token is only reused for 30 seconds, so every resent link still
+# has at least 90% of its lifetime left.
+EMAIL_TOKEN_CACHE_TIMEOUT = 30
+
 
 def generate_email_token(email):
     """
@@ -14,7 +21,26 @@ def generate_email_token(email):
     email_token = generate_token(email)
     return email_token
 
-def verify_email_token(token, max_age=300):
+def get_cached_email_token(email):
+    """
+    Returns the email's recently issued verification token, signing and
+    caching a new one when there is none, so repeated resend requests
+    don't re-sign the same payload.
+    Args:
+        email (str): The email address to issue the token for.
+    Returns:
+        str: A signed token with at least `EMAIL_TOKEN_MAX_AGE -
+            EMAIL_TOKEN_CACHE_TIMEOUT` seconds of validity left.
+    """
+    key = f'emailtok:{email}'
+    token = cache.get(key)
+    if token is None:
+        token = generate_email_token(email)
+        cache.set(key, token, timeout=EMAIL_TOKEN_CACHE_TIMEOUT)
+    return token
+
+
+def verify_email_token(token, max_age=EMAIL_TOKEN_MAX_AGE):
     """
     Verifies an email veriification token.
     Args:
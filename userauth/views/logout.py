@@ -10,6 +10,36 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken, OutstandingToken
+)
+
+
+def blacklist_refresh_token(token):
+    """
+    Blacklists a verified refresh token with one lookup and one insert.
+
+    `RefreshToken.blacklist()` runs `get_or_create` on both the outstanding
+    and the blacklisted token, which is two SELECTs before the INSERT and
+    can raise IntegrityError when two logouts race. The outstanding row the
+    login recorded is looked up by its jti instead, and the blacklist row is
+    inserted with conflicts ignored, so repeating it is harmless.
+
+    Args:
+        token (RefreshToken): The verified refresh token to blacklist.
+    """
+    outstanding_id = OutstandingToken.objects.filter(
+        jti=token[api_settings.JTI_CLAIM]
+    ).values_list('id', flat=True).first()
+    if outstanding_id is None:
+        # Issued outside for_user (no outstanding row yet); let simplejwt
+        # record it.
+        token.blacklist()
+        return
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token_id=outstanding_id)], ignore_conflicts=True
+    )
 
 
 @api_view(['POST'])
@@ -30,8 +60,10 @@ def logout_view(request):
     """
     try:
         refresh_token = request.data['refresh']
+        # Verifies the signature and expiry, and rejects a token that is
+        # already blacklisted.
         token = RefreshToken(refresh_token)
-        token.blacklist()
+        blacklist_refresh_token(token)
     except KeyError:
         return Response(
             {
@@ -8,8 +8,9 @@ for auditing purposes.
 """
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
-from userauth.utils.email_token import generate_email_token
+from rest_framework.decorators import api_view, throttle_classes
+from userauth.throttling import EmailActionRateThrottle
+from userauth.utils.email_token import get_cached_email_token
 from userauth.utils.email_sender import send_verification_email
 from account.models import Account
 import logging
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 
 @api_view(['POST'])
+@throttle_classes([EmailActionRateThrottle])
 def regenerate_token(request):
     """
     Handles the regeneration of a verification token for a user. This function
@@ -41,15 +43,19 @@ def regenerate_token(request):
             - 200 OK if a new verification token is successfully generated and
               sent.
 
-    Raises:
-        Account.DoesNotExist: If no account is found with the provided email.
-
     Side Effects:
-        - Generates a new verification token for the user.
+        - Generates a verification token for the user, reusing one issued
+          within the last `EMAIL_TOKEN_CACHE_TIMEOUT` seconds.
         - Sends a verification email to the user's email address.
         - Logs the token generation for auditing purposes.
     """
     email = request.data.get('email')
+    # Match the form create_user stored, so the lookup is an exact probe on
+    # the unique email index. Anything but a string is treated as missing.
+    email = (
+        Account.objects.normalize_email(email.strip())
+        if isinstance(email, str) else None
+    )
     if not email:
         return Response(
             {"message": "Please input email"},
@@ -58,23 +64,26 @@ def regenerate_token(request):
 
     # Validate email address to ensure that user already registered,
     # and is stored in the database
-    try:
-        account = Account.objects.get(email=email)
-    except Account.DoesNotExist:
+    # Only the verification flag is needed, so read just that column
+    is_verified = Account.objects.filter(email=email).values_list(
+        'is_verified', flat=True
+    ).first()
+    if is_verified is None:
         return Response(
             {"message": "Email not found. Please register first"},
             status=status.HTTP_404_NOT_FOUND
         )
 
     # Check if the account is already verified
-    if account.is_verified:
+    if is_verified:
         return Response(
             {"message": "Account already verified"},
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Generate a new verification token and send the email
-    token = generate_email_token(email)
+    # Reuse the token from a resend within EMAIL_TOKEN_CACHE_TIMEOUT
+    # seconds, or sign a new one, and send the email
+    token = get_cached_email_token(email)
     logger.info("Regenerated token for %s: %s", email, token)
     send_verification_email(email, token)
 
@@ -10,11 +10,12 @@ Views:
       allows the user to set a new password if the token is valid.
 
 """
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, throttle_classes
+from userauth.throttling import EmailActionRateThrottle
 from rest_framework.response import Response
 from rest_framework import status
 from account.models import Account
-from django.shortcuts import get_object_or_404
+from django.contrib.auth.hashers import make_password
 from userauth.utils.password_reset_token import (
     generate_password_reset_token, verify_password_reset_token
 )
@@ -27,6 +28,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 @api_view(['post'])
+@throttle_classes([EmailActionRateThrottle])
 def request_password_reset_view(request):
     """
     Handles password reset requests by generating a password reset token
@@ -43,30 +45,36 @@ def request_password_reset_view(request):
         missing or the account is not verified.
     """
     email = request.data.get('email')
+    # Match the form create_user stored, so the lookup is an exact probe on
+    # the unique email index. Anything but a string is treated as missing.
+    email = (
+        Account.objects.normalize_email(email.strip())
+        if isinstance(email, str) else None
+    )
     if not email:
         return Response({
             "error": "Email is required"
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    try:
-        account = Account.objects.get(email=email)
-        if not account.is_verified:
-            return Response({
-                "error": "Account is not verified"
-            }, status=status.HTTP_400_BAD_REQUEST)
+    # Only the verification flag is needed, so read just that column
+    is_verified = Account.objects.filter(email=email).values_list(
+        'is_verified', flat=True
+    ).first()
+    if is_verified is None:
+        logger.error(
+            "Password reset failed for %s: Account does not exist", email
+        )
+    elif not is_verified:
+        return Response({
+            "error": "Account is not verified"
+        }, status=status.HTTP_400_BAD_REQUEST)
+    else:
         # Generate a password reset token
         # and send the email
         # to the user with the new token
         token = generate_password_reset_token(email)
         send_password_reset_email(email, token)
-        logger.info(
-            f"Password reset email sent to {email}"
-        )
-    except Account.DoesNotExist:
-        logger.error(
-            f"Password reset failed for {email}: "
-            "Account does not exist"
-        )
+        logger.info("Password reset email sent to %s", email)
     return Response({
         "message": (
             "If the email exists, a password reset link has been sent."
@@ -110,17 +118,15 @@ def verify_password_reset_token_view(request):
             "error": "Invalid or expired token"
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    try:
-        user = Account.objects.get(email=email)
-        user.set_password(password)
-        user.save()
-        logger.info(
-            f"Password reset successful for {email}"
-        )
-    except Account.DoesNotExist:
+    # One UPDATE of the hash instead of loading and re-saving the account
+    updated = Account.objects.filter(email=email).update(
+        password=make_password(password)
+    )
+    if updated:
+        logger.info("Password reset successful for %s", email)
+    else:
         logger.error(
-            f"Password reset failed for {email}: "
-            "Account does not exist"
+            "Password reset failed for %s: Account does not exist", email
         )
         return Response({
             "error": "Account does not exist"